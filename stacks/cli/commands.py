@@ -147,8 +147,8 @@ def enrich(input_file: Path, output: Path, set_code: str | None = None) -> None:
             writer.write(enriched_stack, f)
 
         # Print summary
-        original_size = len(list(stack))
-        enriched_size = len(list(enriched_stack))
+        original_size = len(stack)
+        enriched_size = len(enriched_stack)
 
         click.echo("\nEnrichment completed successfully!")
         click.echo(f"Original stack: {original_size} cards")
@@ -211,8 +211,8 @@ def filter_stack(
     _write_filtered_result(filtered_stack, output)
 
     # Report summary
-    original_count = len(list(stack))
-    filtered_count = len(list(filtered_stack))
+    original_count = len(stack)
+    filtered_count = len(filtered_stack)
     click.echo(f"Filtered {original_count} cards down to {filtered_count} cards")
 
 
@@ -117,9 +117,9 @@ def perform_stack_operation(
         write_stack_to_file(normalized_stack, output)
 
         # Print summary
-        stack1_size = len(list(stack1))
-        stack2_size = len(list(stack2))
-        result_size = len(list(result_stack))
+        stack1_size = len(stack1)
+        stack2_size = len(stack2)
+        result_size = len(result_stack)
 
         click.echo("\nOperation completed successfully!")
         click.echo(f"First stack: {stack1_size} cards")
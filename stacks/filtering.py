@@ -6,13 +6,17 @@ various criteria and operators.
 
 from __future__ import annotations
 
+import operator
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from enum import Enum
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from stacks.stack import Stack
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Hashable, Iterable
+
     from stacks.cards.card import Card
 
 T = TypeVar("T", bound="Card")
@@ -35,6 +39,8 @@ class FilterOperator(Enum):
 class PropertyFilter(ABC):
     """Abstract base class for property-based filters."""
 
+    __slots__ = ("operator", "property_name", "value")
+
     def __init__(
         self,
         property_name: str,
@@ -66,8 +72,105 @@ class PropertyFilter(ABC):
         """
 
 
+def _as_members(value: Iterable[Any]) -> frozenset[Any] | tuple[Any, ...]:
+    """Freeze IN/NOT_IN values into a frozenset, or a tuple if unhashable."""
+    try:
+        return frozenset(value)
+    except TypeError:
+        return tuple(value)
+
+
+def _is_member(card_value: Any, members: Collection[Any]) -> bool:  # noqa: ANN401
+    """Check membership, treating unhashable card values as absent from a set."""
+    try:
+        return card_value in members
+    except TypeError:
+        return False
+
+
+# Comparisons keyed by operator; CONTAINS is compiled separately because it
+# lowercases the filter value once up front
+_COMPARISONS: dict[FilterOperator, Callable[[Any, Any], bool]] = {
+    FilterOperator.EQUALS: operator.eq,
+    FilterOperator.NOT_EQUALS: operator.ne,
+    FilterOperator.GREATER_THAN: operator.gt,
+    FilterOperator.LESS_THAN: operator.lt,
+    FilterOperator.GREATER_EQUAL: operator.ge,
+    FilterOperator.LESS_EQUAL: operator.le,
+    FilterOperator.IN: _is_member,
+    FilterOperator.NOT_IN: lambda cv, v: not _is_member(cv, v),
+}
+
+# Ordering comparisons never match a missing (None) property value
+_ORDERINGS = frozenset(
+    {
+        FilterOperator.GREATER_THAN,
+        FilterOperator.LESS_THAN,
+        FilterOperator.GREATER_EQUAL,
+        FilterOperator.LESS_EQUAL,
+    },
+)
+
+_MISSING = object()
+
+# Rough evaluation order for AND-ed filters: equality and membership tend to
+# reject the most cards, while CONTAINS does a substring scan per card
+_OPERATOR_COST = {
+    FilterOperator.EQUALS: 0,
+    FilterOperator.IN: 0,
+    FilterOperator.CONTAINS: 2,
+}
+_DEFAULT_COST = 1
+
+# Upper bound on remembered CONTAINS verdicts per filter; the oldest entry is
+# dropped first
+_VERDICT_CACHE_SIZE = 1024
+
+
+def _compile_contains(
+    get: Callable[[object], Any],
+    needle: str,
+) -> Callable[[object], bool]:
+    """Build a case-insensitive substring predicate for a lowercased needle."""
+    # Cards repeat the same names and types, so remember each verdict rather
+    # than lowercasing and scanning the same text again
+    verdicts: dict[str, bool] = {}
+
+    def contains(card: object) -> bool:
+        try:
+            card_value = get(card)
+        except AttributeError:
+            return False
+        text = str(card_value)
+        verdict = verdicts.get(text)
+        if verdict is None:
+            if len(verdicts) >= _VERDICT_CACHE_SIZE:
+                # Drop the oldest entry; dicts keep insertion order
+                del verdicts[next(iter(verdicts))]
+            verdict = verdicts[text] = needle in text.lower()
+        return verdict
+
+    return contains
+
+
 class CardPropertyFilter(PropertyFilter):
-    """Concrete implementation of PropertyFilter for card objects."""
+    """Concrete implementation of PropertyFilter for card objects.
+
+    The filter compiles its operator and value into a predicate on first use.
+    Reassigning ``property_name``, ``operator`` or ``value`` recompiles it,
+    but changing a list or set value in place does not; reassign ``value``
+    (``f.value = f.value`` is enough) to pick up such changes.
+    """
+
+    __slots__ = ("_predicate",)
+
+    _PREDICATE_FIELDS = frozenset({"property_name", "operator", "value"})
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Set an attribute, discarding the compiled predicate if it goes stale."""
+        super().__setattr__(name, value)
+        if name in self._PREDICATE_FIELDS:
+            super().__setattr__("_predicate", None)
 
     def apply(self, card: object) -> bool:
         """Apply the filter to a card.
@@ -79,29 +182,77 @@ class CardPropertyFilter(PropertyFilter):
             True if the card passes the filter, False otherwise.
 
         """
-        if not hasattr(card, self.property_name):
-            return False
+        if self._predicate is None:
+            self._predicate = self._compile()
+        return self._predicate(card)
 
-        card_value = getattr(card, self.property_name)
-
-        # Create operator mapping to reduce complexity and return statements
-        operators = {
-            FilterOperator.EQUALS: lambda cv, v: cv == v,
-            FilterOperator.NOT_EQUALS: lambda cv, v: cv != v,
-            FilterOperator.CONTAINS: lambda cv, v: v.lower() in str(cv).lower(),
-            FilterOperator.GREATER_THAN: lambda cv, v: cv is not None and cv > v,
-            FilterOperator.LESS_THAN: lambda cv, v: cv is not None and cv < v,
-            FilterOperator.GREATER_EQUAL: lambda cv, v: cv is not None and cv >= v,
-            FilterOperator.LESS_EQUAL: lambda cv, v: cv is not None and cv <= v,
-            FilterOperator.IN: lambda cv, v: cv in v,
-            FilterOperator.NOT_IN: lambda cv, v: cv not in v,
-        }
-
-        operation = operators.get(self.operator)
-        if operation:
-            return operation(card_value, self.value)
+    def _compile(self) -> Callable[[object], bool]:
+        """Build a predicate specialised to this filter's operator and value.
 
-        return False
+        Returns:
+            A callable that checks a single card against the filter.
+
+        """
+        get = operator.attrgetter(self.property_name)
+        value = self.value
+
+        if self.operator is FilterOperator.CONTAINS:
+            return _compile_contains(get, value.lower())  # type: ignore[attr-defined]
+
+        membership = self.operator in (FilterOperator.IN, FilterOperator.NOT_IN)
+        # Strings keep their substring semantics for IN/NOT_IN
+        if membership and not isinstance(value, str):
+            value = _as_members(value)  # type: ignore[arg-type]
+
+        compare = _COMPARISONS.get(self.operator)  # type: ignore[arg-type]
+        if compare is None:
+            return lambda _card: False
+
+        if self.operator in _ORDERINGS:
+
+            def ordered(card: object) -> bool:
+                try:
+                    card_value = get(card)
+                except AttributeError:
+                    return False
+                return card_value is not None and compare(card_value, value)
+
+            return ordered
+
+        def predicate(card: object) -> bool:
+            try:
+                card_value = get(card)
+            except AttributeError:
+                return False
+            return compare(card_value, value)
+
+        return predicate
+
+
+def _build_index(
+    cards: list[T],
+    property_name: str,
+) -> dict[Hashable, list[int]] | None:
+    """Map each value of a property to the positions of the cards holding it.
+
+    Args:
+        cards: The cards to index.
+        property_name: Name of the property to index.
+
+    Returns:
+        The value index, or None if some card holds an unhashable value.
+
+    """
+    index: dict[Hashable, list[int]] = defaultdict(list)
+    for position, card in enumerate(cards):
+        value = getattr(card, property_name, _MISSING)
+        if value is _MISSING:
+            continue
+        try:
+            index[value].append(position)
+        except TypeError:
+            return None
+    return index
 
 
 class FilterableStack(Generic[T]):
@@ -115,6 +266,10 @@ class FilterableStack(Generic[T]):
 
         """
         self.stack = stack
+        # Per-property value indexes over a snapshot of the stack's copies
+        self._indexed_for: tuple[Stack[T], int] | None = None
+        self._indexed_cards: list[T] = []
+        self._indexes: dict[str, dict[Hashable, list[int]] | None] = {}
 
     def filter(self, *filters: PropertyFilter) -> Stack[T]:
         """Apply multiple filters to the stack.
@@ -126,15 +281,122 @@ class FilterableStack(Generic[T]):
             A new Stack containing only the cards that pass all filters.
 
         """
-        # Use list comprehension for better performance as suggested
-        filtered_cards = [
-            card
-            for card in self.stack
-            if all(filter_obj.apply(card) for filter_obj in filters)
-        ]
-
-        # Create new stack with same type as original
+        if not filters:
+            return self.stack.copy()
+
+        # Run the selective, cheap checks first so all() can stop early
+        ordered = sorted(
+            filters,
+            key=lambda f: _OPERATOR_COST.get(f.operator, _DEFAULT_COST),
+        )
+
+        candidates, scanned = self._narrow(ordered)
+
+        # Copies of a card come out of the stack back to back and parsers share
+        # one frozen instance between them, so only judge each instance once.
+        # Subclasses may keep state or side effects in apply, so they still
+        # see every copy. Cards that pass go straight into the result.
+        reuse_verdicts = all(
+            type(filter_obj) is CardPropertyFilter for filter_obj in scanned
+        )
         result: Stack[T] = Stack()
-        for card in filtered_cards:
-            result.add(card)
+        last_card: object = _MISSING
+        passed = False
+        for card in candidates:
+            if card is not last_card or not reuse_verdicts:
+                last_card = card
+                passed = all(filter_obj.apply(card) for filter_obj in scanned)
+            if passed:
+                result.add(card)
+
         return result
+
+    def _narrow(
+        self,
+        filters: list[PropertyFilter],
+    ) -> tuple[Iterable[T], list[PropertyFilter]]:
+        """Resolve EQUALS/IN filters through the value indexes.
+
+        Args:
+            filters: The filters being applied.
+
+        Returns:
+            The candidate cards in stack order, and the filters that still
+            have to be checked against each candidate.
+
+        """
+        positions: set[int] | None = None
+        scanned: list[PropertyFilter] = []
+        for filter_obj in filters:
+            found = self._positions(filter_obj)
+            if found is None:
+                scanned.append(filter_obj)
+            else:
+                positions = found if positions is None else positions & found
+                if not positions:
+                    # No card can pass; skip indexing or scanning the rest
+                    return [], []
+
+        if positions is None:
+            return self.stack, scanned
+        return [self._indexed_cards[i] for i in sorted(positions)], scanned
+
+    def _positions(self, filter_obj: PropertyFilter) -> set[int] | None:
+        """Look up the positions of the cards an EQUALS/IN filter accepts.
+
+        Args:
+            filter_obj: The filter to resolve.
+
+        Returns:
+            Positions in the indexed snapshot, or None if the filter has to
+            be evaluated by scanning.
+
+        """
+        # Subclasses may override apply, so only the stock filter is indexed
+        if type(filter_obj) is not CardPropertyFilter:
+            return None
+        if filter_obj.operator is FilterOperator.EQUALS:
+            wanted: object = (filter_obj.value,)
+        elif filter_obj.operator is FilterOperator.IN and not isinstance(
+            filter_obj.value,
+            str,
+        ):
+            wanted = filter_obj.value
+        else:
+            return None
+
+        index = self._property_index(filter_obj.property_name)
+        if index is None:
+            return None
+
+        positions: set[int] = set()
+        try:
+            for value in wanted:  # type: ignore[attr-defined]
+                positions.update(index.get(value, ()))
+        except TypeError:
+            return None
+        return positions
+
+    def _property_index(self, property_name: str) -> dict[Hashable, list[int]] | None:
+        """Get the value index for a property, rebuilding it if the stack changed.
+
+        Args:
+            property_name: Name of the property to index.
+
+        Returns:
+            A mapping of property values to snapshot positions, or None if
+            the property holds unhashable values.
+
+        """
+        snapshot = (self.stack, self.stack.version)
+        if self._indexed_for != snapshot:
+            self._indexed_for = snapshot
+            self._indexed_cards = list(self.stack)
+            self._indexes = {}
+
+        if property_name not in self._indexes:
+            self._indexes[property_name] = _build_index(
+                self._indexed_cards,
+                property_name,
+            )
+        return self._indexes[property_name]
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import re
+import sys
 from collections import Counter
+from io import StringIO
 from pathlib import Path
 from typing import IO, TYPE_CHECKING
 
@@ -17,6 +19,22 @@ from stacks.stack import Stack
 
 from .abstractions import StackReader, StackWriter
 
+# Section headers that may appear between card lines in Arena exports
+_SECTION_HEADERS = frozenset({"Deck", "Sideboard", "Commander", "Maybeboard"})
+
+# Both patterns scan the whole deck at once. ``[^\S\n]`` is whitespace other
+# than a newline, so no match ever spans two lines.
+# Matches card lines like "4 Card Name", capturing the count and trimmed name
+_CARD_LINE_RE = re.compile(r"(?m)^[^\S\n]*(\d+)[^\S\n]+(\S.*?)[^\S\n]*$")
+
+# Matches the first character of any line that is neither blank, a section
+# header, nor a card line
+_INVALID_LINE_RE = re.compile(
+    r"(?m)^[^\S\n]*(?!$|\d+[^\S\n]+\S|(?:"
+    + "|".join(sorted(_SECTION_HEADERS))
+    + r")[^\S\n]*$)\S",
+)
+
 
 def parse_arena_deck_file(file_path: str | Path) -> Stack[Card]:
     """Parse an Arena deck file into a Stack of cards.
@@ -44,13 +62,16 @@ def parse_arena_deck_file(file_path: str | Path) -> Stack[Card]:
     """
     file_path = Path(file_path)
 
-    if not file_path.exists():
+    # Read the whole deck in one call; a missing file surfaces from the read
+    # itself instead of a separate exists() check beforehand
+    try:
+        content = file_path.read_text(encoding="utf-8")
+    except FileNotFoundError as exc:
         msg = f"File not found: {file_path}"
-        raise FileNotFoundError(msg)
+        raise FileNotFoundError(msg) from exc
 
     reader = ArenaStackReader()
-    with file_path.open(encoding="utf-8") as f:
-        return reader.read_with_source(f, file_path)
+    return reader.read_with_source(StringIO(content), file_path)
 
 
 def parse_arena_deck_content(content: str) -> Stack[Card]:
@@ -66,8 +87,6 @@ def parse_arena_deck_content(content: str) -> Stack[Card]:
         ValueError: If the content format is invalid.
 
     """
-    from io import StringIO
-
     reader = ArenaStackReader()
     with StringIO(content) as f:
         return reader.read(f)
@@ -81,11 +100,8 @@ def write_arena_deck_file(stack: Stack[Card], file_path: str | Path) -> None:
         file_path: Path where the Arena deck file will be written.
 
     """
-    file_path = Path(file_path)
-
-    writer = ArenaStackWriter()
-    with file_path.open("w", encoding="utf-8") as f:
-        writer.write(stack, f)
+    # Format in memory and hand the whole deck to the file in a single write
+    Path(file_path).write_text(format_arena_deck_content(stack), encoding="utf-8")
 
 
 def format_arena_deck_content(stack: Stack[Card]) -> str:
@@ -98,8 +114,6 @@ def format_arena_deck_content(stack: Stack[Card]) -> str:
         The formatted Arena deck content as a string.
 
     """
-    from io import StringIO
-
     writer = ArenaStackWriter()
     with StringIO() as f:
         writer.write(stack, f)
@@ -126,45 +140,77 @@ class ArenaStackReader(StackReader[Card]):
         content = file.read()
         return self._parse_arena_deck_content(content)
 
-    def _parse_arena_deck_content(self, content: str) -> Stack[Card]:
-        """Parse Arena deck content into a Stack of cards."""
-        cards: list[Card] = []
+    def read_with_source(self, file: IO, source: Path | None = None) -> Stack[Card]:
+        """Read an Arena deck file and set the source property on all cards.
 
-        for card_name, count in self._parse_deck_lines(content):
-            # Add the specified number of copies to the list
-            cards.extend(Card(name=card_name) for _ in range(count))
+        The source is attached as each card is built, so the cards are not
+        rebuilt afterwards.
+
+        Args:
+            file: File-like object containing Arena deck content.
+            source: Path to the source file.
+
+        Returns:
+            A Stack with all cards having their source property set.
 
-        return Stack(cards)
+        """
+        return self._parse_arena_deck_content(file.read(), source)
 
-    def _parse_deck_lines(self, content: str) -> Iterator[tuple[str, int]]:
-        """Parse deck lines and yield (card_name, count) tuples."""
-        # Regex pattern to match lines like "4 Card Name" or "1 Card Name"
-        card_pattern = re.compile(r"^(\d+)\s+(.+)$")
+    def _parse_arena_deck_content(
+        self,
+        content: str,
+        source: Path | None = None,
+    ) -> Stack[Card]:
+        """Parse Arena deck content into a Stack of cards."""
+        stack: Stack[Card] = Stack()
 
-        for line_num, original_line in enumerate(content.strip().split("\n"), 1):
-            line = original_line.strip()
+        for card_name, count in self._parse_deck_lines(content):
+            # Cards are frozen, so every copy can share a single validated instance
+            stack.add(Card(name=card_name, source=source), count=count)
 
-            # Skip empty lines and section headers
-            if not line or line in ("Deck", "Sideboard"):
-                continue
+        return stack
 
-            match = card_pattern.match(line)
-            if not match:
-                msg = f"Invalid card line format at line {line_num}: '{line}'"
-                raise ValueError(msg)
+    def _parse_deck_lines(self, content: str) -> Iterator[tuple[str, int]]:
+        """Parse deck lines and yield (card_name, count) tuples.
 
+        Errors name the first offending line in file order. Line numbers
+        count every line of the content, leading blank lines included.
+        """
+        # The patterns below only split on "\n", so fold CRLF and bare CR
+        # endings into it; other characters never end a line
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+        # Find the first malformed line up front so the card scan below can
+        # skip blank lines and section headers without looking at them
+        invalid = _INVALID_LINE_RE.search(content)
+        end = invalid.start() if invalid else len(content)
+
+        # Only card lines before the malformed one are scanned, so a bad
+        # count on an earlier line is still the error that gets reported
+        for match in _CARD_LINE_RE.finditer(content, 0, end):
+            # The pattern only admits digits, so int() cannot fail here
             count_str, card_name = match.groups()
-            try:
-                count = int(count_str)
-            except ValueError as exc:
-                msg = f"Invalid count '{count_str}' at line {line_num}"
-                raise ValueError(msg) from exc
-
+            count = int(count_str)
             if count <= 0:
+                line_num = self._line_number(content, match.start())
                 msg = f"Count must be positive, got {count} at line {line_num}"
                 raise ValueError(msg)
 
-            yield card_name.strip(), count
+            # Intern names so repeated cards share one string object
+            yield sys.intern(card_name), count
+
+        if invalid:
+            line = content[invalid.start() :].split("\n", 1)[0].strip()
+            msg = (
+                f"Invalid card line format at line "
+                f"{self._line_number(content, invalid.start())}: '{line}'"
+            )
+            raise ValueError(msg)
+
+    @staticmethod
+    def _line_number(content: str, position: int) -> int:
+        """Return the 1-based line number of a position in the content."""
+        return content.count("\n", 0, position) + 1
 
 
 @register_writer("arena")
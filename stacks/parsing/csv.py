@@ -3,15 +3,85 @@
 from __future__ import annotations
 
 import csv
+import re
+import sys
+from collections import Counter
+from itertools import zip_longest
 from pathlib import Path
-from typing import IO, Any, TextIO
+from typing import IO, TYPE_CHECKING, Any, TextIO
 
+from stacks.cards.card import Card
+from stacks.cards.colors import Color
 from stacks.cards.print import Print
+from stacks.cards.scryfall_card import ScryfallCard
 from stacks.parsing.io_registry import register_reader, register_writer
 from stacks.stack import Stack
 
 from .abstractions import StackReader, StackWriter
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+# All formats require these basic columns
+_BASIC_REQUIRED_COLUMNS = frozenset({"Count", "Card Name"})
+
+# Print needs the basic columns + Set Name; Foil and Price have defaults
+_PRINT_REQUIRED_COLUMNS = _BASIC_REQUIRED_COLUMNS | {"Set Name"}
+
+# Foil cell values (after strip and lower) that mark a print as foil; any
+# other value, including an empty cell, means non-foil
+_FOIL_TRUE_VALUES = frozenset({"true", "1", "yes", "t", "y"})
+
+# Buffer size used when writing CSV collection files
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Header row written by CsvStackWriter, in column order
+_PRINT_CSV_HEADER = (
+    "Count",
+    "Card Name",
+    "Set Name",
+    "Collector Number",
+    "Foil",
+    "Price",
+    "Tags",
+)
+
+# A single tag: no commas, no leading or trailing whitespace
+_TAG_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
+# Scryfall-specific columns that indicate ScryfallCard format
+_SCRYFALL_MARKER_COLUMNS = frozenset(
+    {
+        "Set Code",
+        "Oracle ID",
+        "Mana Cost",
+        "Type Line",
+        "Rarity",
+        "Oracle Text",
+        "Colors",
+        "Image URL",
+    },
+)
+_MIN_SCRYFALL_MARKER_COLUMNS = 3
+
+# Print-specific columns (excluding basic ones like Card Name)
+_PRINT_MARKER_COLUMNS = frozenset({"Set Name", "Foil", "Price"})
+
+# Columns that carry ScryfallCard data beyond the basic ones
+_SCRYFALL_DATA_COLUMNS = frozenset(
+    {
+        "Set Code",
+        "Oracle ID",
+        "Mana Cost",
+        "Type Line",
+        "Rarity",
+        "Oracle Text",
+        "Colors",
+        "Image URL",
+        "Price USD",
+    },
+)
+
 
 def parse_csv_collection_file(file_path: str | Path) -> Stack:
     """Parse a CSV collection export file into a Stack of cards.
@@ -34,12 +104,18 @@ def parse_csv_collection_file(file_path: str | Path) -> Stack:
     """
     file_path = Path(file_path)
 
-    if not file_path.exists():
+    # A missing file surfaces from open() itself instead of a separate
+    # exists() check beforehand
+    try:
+        csvfile = file_path.open(encoding="utf-8", newline="")
+    except FileNotFoundError as exc:
         msg = f"File not found: {file_path}"
-        raise FileNotFoundError(msg)
+        raise FileNotFoundError(msg) from exc
 
+    # Stream rows straight from the file rather than copying the whole text
+    # into a StringIO first
     reader = CsvStackReader()
-    with file_path.open(encoding="utf-8") as csvfile:
+    with csvfile:
         return reader.read_with_source(csvfile, file_path)
 
 
@@ -79,7 +155,13 @@ def write_csv_collection_file(stack: Stack[Print], file_path: str | Path) -> Non
     file_path = Path(file_path)
 
     writer = CsvStackWriter()
-    with file_path.open("w", encoding="utf-8", newline="") as csvfile:
+    # A large buffer lets the rows reach the disk in a few big writes
+    with file_path.open(
+        "w",
+        encoding="utf-8",
+        newline="",
+        buffering=_WRITE_BUFFER_SIZE,
+    ) as csvfile:
         writer.write(stack, csvfile)
 
 
@@ -118,21 +200,83 @@ class CsvStackReader(StackReader):
             ValueError: If the file format is invalid.
 
         """
-        cards: list[Any] = []
         reader = csv.DictReader(file)
+        return self._read_records(reader.fieldnames, reader)
+
+    def read_with_source(self, file: IO, source: Path | None = None) -> Stack:
+        """Read a CSV collection file and set the source property on all cards.
+
+        The source is attached as each card is built, so pooled copies keep
+        sharing one instance and are not rebuilt afterwards.
+
+        Args:
+            file: File-like object containing CSV collection content.
+            source: Path to the source file.
+
+        Returns:
+            A Stack with all cards having their source property set.
+
+        """
+        reader = csv.DictReader(file)
+        return self._read_records(reader.fieldnames, reader, source)
+
+    def from_rows(self, rows: Iterable[Sequence[str]]) -> Stack:
+        """Build a Stack from already split CSV rows, header row first.
+
+        This accepts the rows produced by ``CsvStackWriter.iter_rows`` or
+        ``csv.reader``, so in-process round trips skip text encoding.
+
+        Args:
+            rows: Iterable of rows whose first row holds the column names.
+
+        Returns:
+            A Stack containing cards of the appropriate type.
+
+        Raises:
+            ValueError: If the rows are not a valid collection.
+
+        """
+        rows = iter(rows)
+        fieldnames = list(next(rows, ()))
+        # Mirror csv.DictReader: skip empty rows, fill missing columns with
+        # None and key extra values under None
+        records = (dict(zip_longest(fieldnames, row)) for row in rows if row)
+        return self._read_records(fieldnames, records)
+
+    def _read_records(
+        self,
+        fieldnames: Sequence[str] | None,
+        records: Iterable[dict[str | None, Any]],
+        source: Path | None = None,
+    ) -> Stack:
+        """Parse header-keyed records into a Stack of cards."""
+        cards: list[Any] = []
 
         # Determine card type based on available columns
-        card_type = self._detect_card_type(reader)
-        self._validate_csv_headers(reader, card_type)
+        card_type = self._detect_card_type(fieldnames)
+        self._validate_csv_headers(fieldnames, card_type)
+
+        # Rows describing the same card share one instance within this read
+        card_pool: dict[tuple, Any] = {}
 
         # Start at 2 since header is row 1
-        for row_num, row in enumerate(reader, start=2):
-            row_cards = self._parse_csv_row(row, row_num, card_type)
+        for row_num, row in enumerate(records, start=2):
+            # Short rows leave their missing columns as None
+            if None in row.values():
+                msg = f"Row {row_num} has fewer columns than the header"
+                raise ValueError(msg)
+            row_cards = self._parse_csv_row(
+                row,
+                row_num,
+                card_type,
+                card_pool,
+                source,
+            )
             cards.extend(row_cards)
 
         return Stack(cards)
 
-    def _detect_card_type(self, reader: csv.DictReader) -> str:
+    def _detect_card_type(self, fieldnames: Sequence[str] | None) -> str:
         """Detect the card type based on available CSV columns.
 
         Returns:
@@ -141,83 +285,49 @@ class CsvStackReader(StackReader):
             "card" for basic card columns only
 
         """
-        if not reader.fieldnames:
+        if not fieldnames:
             return "card"
 
-        columns = set(reader.fieldnames)
-
-        # Scryfall-specific columns that indicate ScryfallCard format
-        scryfall_columns = {
-            "Set Code",
-            "Oracle ID",
-            "Mana Cost",
-            "Type Line",
-            "Rarity",
-            "Oracle Text",
-            "Colors",
-            "Image URL",
-        }
-
-        # Print-specific columns (excluding basic ones like Card Name)
-        print_columns = {"Set Name", "Foil", "Price"}
+        columns = frozenset(fieldnames)
 
         # Check for Scryfall format (requires multiple specific columns)
-        min_scryfall_columns = 3
-        if len(scryfall_columns.intersection(columns)) >= min_scryfall_columns:
+        if len(_SCRYFALL_MARKER_COLUMNS & columns) >= _MIN_SCRYFALL_MARKER_COLUMNS:
             return "scryfall"
 
         # Check for Print format (requires at least Set Name or Foil)
-        if len(print_columns.intersection(columns)) >= 1:
+        if not _PRINT_MARKER_COLUMNS.isdisjoint(columns):
             return "print"
 
         # Default to basic Card if only name is available
         return "card"
 
-    def _validate_csv_headers(self, reader: csv.DictReader, card_type: str) -> None:
+    def _validate_csv_headers(
+        self,
+        fieldnames: Sequence[str] | None,
+        card_type: str,
+    ) -> None:
         """Validate that required CSV columns exist for the detected card type."""
-        if not reader.fieldnames:
+        if not fieldnames:
             msg = "CSV file has no headers"
             raise ValueError(msg)
 
-        columns = set(reader.fieldnames)
-
-        # All formats require these basic columns
-        basic_required = {"Count", "Card Name"}
+        columns = frozenset(fieldnames)
 
         if card_type == "scryfall":
             # For ScryfallCard, we need Count, Card Name, and at least one field
-            required_columns = basic_required
-            scryfall_columns = {
-                "Set Code",
-                "Oracle ID",
-                "Mana Cost",
-                "Type Line",
-                "Rarity",
-                "Oracle Text",
-                "Colors",
-                "Image URL",
-                "Price USD",
-            }
-            if not scryfall_columns.intersection(columns):
+            required_columns = _BASIC_REQUIRED_COLUMNS
+            if columns.isdisjoint(_SCRYFALL_DATA_COLUMNS):
                 msg = "CSV appears to be Scryfall format but missing Scryfall columns"
                 raise ValueError(msg)
         elif card_type == "print":
-            # For Print, we only need the basic columns + Set Name
-            # Foil and Price are optional (have defaults)
-            required_columns = basic_required | {"Set Name"}
+            required_columns = _PRINT_REQUIRED_COLUMNS
         else:  # card_type == "card"
             # For basic Card, we only need name and count
-            required_columns = basic_required
+            required_columns = _BASIC_REQUIRED_COLUMNS
 
         missing = required_columns - columns
         if missing:
-            msg = f"Missing required columns for {card_type} format: {missing}"
-            raise ValueError(msg)
-
-    def _validate_count(self, count: int, row_num: int) -> None:
-        """Validate that count is positive."""
-        if count <= 0:
-            msg = f"Count must be positive, got {count} at row {row_num}"
+            msg = f"Missing required columns for {card_type} format: {sorted(missing)}"
             raise ValueError(msg)
 
     def _validate_card_name(self, card_name: str, row_num: int) -> None:
@@ -226,13 +336,17 @@ class CsvStackReader(StackReader):
             msg = f"Card name cannot be empty at row {row_num}"
             raise ValueError(msg)
 
-    def _safe_int(self, value: str, field_name: str, row_num: int) -> int:
-        """Safely convert string to int with error context."""
+    def _parse_count(self, value: str, row_num: int) -> int:
+        """Convert a count to int and check it is positive in one step."""
         try:
-            return int(value)
+            count = int(value)
         except ValueError as exc:
-            msg = f"Invalid {field_name} '{value}' at row {row_num}"
+            msg = f"Invalid count '{value}' at row {row_num}"
             raise ValueError(msg) from exc
+        if count <= 0:
+            msg = f"Count must be positive, got {count} at row {row_num}"
+            raise ValueError(msg)
+        return count
 
     def _safe_int_optional(
         self,
@@ -261,47 +375,46 @@ class CsvStackReader(StackReader):
 
     def _parse_tags(self, tags_str: str) -> set[str]:
         """Parse tags from a comma-separated string."""
-        if not tags_str.strip():
-            return set()
-        # Split by comma and strip whitespace from each tag
-        return {tag.strip() for tag in tags_str.split(",") if tag.strip()}
+        # Each match is one comma-separated tag with surrounding whitespace trimmed
+        return set(_TAG_RE.findall(tags_str))
 
     def _parse_csv_row(
         self,
         row: dict[str, str],
         row_num: int,
         card_type: str,
+        card_pool: dict[tuple, Any] | None = None,
+        source: Path | None = None,
     ) -> list[Any]:
         """Parse a single CSV row into a list of card objects."""
-        count = self._safe_int(row["Count"], "count", row_num)
-        card_name = row["Card Name"].strip()
-
-        self._validate_count(count, row_num)
+        count = self._parse_count(row["Count"], row_num)
+        # Intern names so repeated cards share one string object
+        card_name = sys.intern(row["Card Name"].strip())
         self._validate_card_name(card_name, row_num)
 
+        # Cards are frozen, so every copy can share a single validated instance
+        card: Any
         if card_type == "scryfall":
-            return self._create_scryfall_cards(row, card_name, count, row_num)
-        if card_type == "print":
-            return self._create_print_cards(row, card_name, count, row_num)
-
-        # For basic cards, parse tags if present
-        tags: set[str] = set()
-        if "Tags" in row:
-            tags = self._parse_tags(row["Tags"])
+            card = self._create_scryfall_card(row, card_name, row_num, source)
+        elif card_type == "print":
+            card = self._create_print_card(row, card_name, row_num, card_pool, source)
+        else:
+            # For basic cards, parse tags if present
+            tags: set[str] = set()
+            if "Tags" in row:
+                tags = self._parse_tags(row["Tags"])
+            card = self._create_basic_card(card_name, tags, card_pool, source)
 
-        return self._create_basic_cards(card_name, count, tags)
+        return [card] * count
 
-    def _create_scryfall_cards(
+    def _create_scryfall_card(
         self,
         row: dict[str, str],
         card_name: str,
-        count: int,
         row_num: int,
-    ) -> list[Any]:
-        """Create ScryfallCard objects from CSV row data."""
-        from stacks.cards.colors import Color
-        from stacks.cards.scryfall_card import ScryfallCard
-
+        source: Path | None = None,
+    ) -> ScryfallCard:
+        """Create a ScryfallCard from CSV row data."""
         oracle_id = row["Oracle ID"]
 
         # Parse colors if present
@@ -324,35 +437,37 @@ class CsvStackReader(StackReader):
         if "Tags" in row:
             tags = self._parse_tags(row["Tags"])
 
-        # Create the specified number of card copies
-        return [
-            ScryfallCard(
-                name=card_name,
-                oracle_id=oracle_id,
-                set_code=row.get("Set Code") or None,
-                collector_number=row.get("Collector Number") or None,
-                mana_cost=row.get("Mana Cost") or None,
-                type_line=row.get("Type Line") or None,
-                rarity=row.get("Rarity") or None,
-                oracle_text=row.get("Oracle Text") or None,
-                price_usd=price_usd,
-                image_url=row.get("Image URL") or None,
-                colors=colors,
-                tags=tags,
-            )
-            for _ in range(count)
-        ]
-
-    def _create_print_cards(
+        return ScryfallCard(
+            name=card_name,
+            oracle_id=oracle_id,
+            set_code=sys.intern(row["Set Code"]) if row.get("Set Code") else None,
+            collector_number=row.get("Collector Number") or None,
+            mana_cost=row.get("Mana Cost") or None,
+            type_line=row.get("Type Line") or None,
+            rarity=row.get("Rarity") or None,
+            oracle_text=row.get("Oracle Text") or None,
+            price_usd=price_usd,
+            image_url=row.get("Image URL") or None,
+            colors=colors,
+            tags=tags,
+            source=source,
+        )
+
+    def _create_print_card(
         self,
         row: dict[str, str],
         card_name: str,
-        count: int,
         row_num: int,
-    ) -> list[Print]:
-        """Create Print objects from CSV row data."""
-        set_name = row.get("Set Name", "").strip()
-        foil = row.get("Foil", "false").lower() in ("true", "1", "yes")
+        print_pool: dict[tuple, Print] | None = None,
+        source: Path | None = None,
+    ) -> Print:
+        """Create a Print from CSV row data.
+
+        When ``print_pool`` is given, rows with identical print fields reuse
+        the instance built for the first such row.
+        """
+        set_name = sys.intern(row.get("Set Name", "").strip())
+        foil = row.get("Foil", "").strip().lower() in _FOIL_TRUE_VALUES
 
         # Use _safe_float for price validation
         price = None
@@ -369,32 +484,44 @@ class CsvStackReader(StackReader):
         if "Collector Number" in row and row["Collector Number"].strip():
             collector_number = row["Collector Number"].strip()
 
-        # Create the specified number of print copies
-        return [
-            Print(
+        key = (card_name, set_name, foil, price, collector_number, frozenset(tags))
+        print_card = print_pool.get(key) if print_pool is not None else None
+        if print_card is None:
+            print_card = Print(
                 name=card_name,
                 set=set_name,
                 foil=foil,
                 price=price,
                 collector_number=collector_number,
                 tags=tags,
+                source=source,
             )
-            for _ in range(count)
-        ]
+            if print_pool is not None:
+                print_pool[key] = print_card
+        return print_card
 
-    def _create_basic_cards(
+    def _create_basic_card(
         self,
         card_name: str,
-        count: int,
         tags: set[str] | None = None,
-    ) -> list[Any]:
-        """Create basic Card objects."""
-        from stacks.cards.card import Card
+        card_pool: dict[tuple, Any] | None = None,
+        source: Path | None = None,
+    ) -> Card:
+        """Create a basic Card.
 
+        When ``card_pool`` is given, rows with the same name and tags reuse
+        the instance built for the first such row.
+        """
         if tags is None:
             tags = set()
 
-        return [Card(name=card_name, tags=tags) for _ in range(count)]
+        key = (card_name, frozenset(tags))
+        card = card_pool.get(key) if card_pool is not None else None
+        if card is None:
+            card = Card(name=card_name, tags=tags, source=source)
+            if card_pool is not None:
+                card_pool[key] = card
+        return card
 
 
 @register_writer("csv")
@@ -412,41 +539,42 @@ class CsvStackWriter(StackWriter[Print]):
             ValueError: If the stack is empty.
 
         """
-        if len(list(stack)) == 0:
+        if len(stack) == 0:
             msg = "Cannot write an empty stack"
             raise ValueError(msg)
 
-        # Group prints by their properties to calculate counts
-        print_groups = self._group_prints_by_properties(stack)
+        # Positional rows skip DictWriter's per-row dict building; csv.writer
+        # still quotes names and tag lists that contain commas. Every row,
+        # header included, goes to the C writer in one writerows call.
+        csv.writer(file).writerows(self.iter_rows(stack))
 
-        # Write CSV header
-        fieldnames = [
-            "Count",
-            "Card Name",
-            "Set Name",
-            "Collector Number",
-            "Foil",
-            "Price",
-            "Tags",
-        ]
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
+    def iter_rows(self, stack: Stack[Print]) -> Iterator[tuple[str, ...]]:
+        """Yield the CSV rows for a Stack of prints, header row first.
 
-        # Write each group as a row
-        for print_item, count in print_groups.items():
-            # Format tags as comma-separated string
-            tags_str = ",".join(print_item.tags) if print_item.tags else ""
+        The rows can be passed to ``csv.writer`` or straight back into
+        ``CsvStackReader.from_rows``.
 
-            row = {
-                "Count": count,
-                "Card Name": print_item.name,
-                "Set Name": print_item.set or "",
-                "Collector Number": "",  # Not available in Print model
-                "Foil": str(print_item.foil).lower(),
-                "Price": print_item.price if print_item.price is not None else "",
-                "Tags": tags_str,
-            }
-            writer.writerow(row)
+        Args:
+            stack: Stack of prints to convert.
+
+        Yields:
+            The header row, then one row of string fields per print group.
+
+        """
+        yield _PRINT_CSV_HEADER
+
+        # Group prints by their properties to calculate counts
+        for print_item, count in self._group_prints_by_properties(stack).items():
+            yield (
+                str(count),
+                print_item.name,
+                print_item.set or "",
+                "",  # Collector Number is not written for prints
+                "true" if print_item.foil else "false",
+                str(print_item.price) if print_item.price is not None else "",
+                # Format tags as comma-separated string
+                ",".join(print_item.tags) if print_item.tags else "",
+            )
 
     def _group_prints_by_properties(self, stack: Stack[Print]) -> dict[Print, int]:
         """Group prints by their properties and count occurrences.
@@ -458,24 +586,30 @@ class CsvStackWriter(StackWriter[Print]):
             Dictionary mapping unique prints to their counts.
 
         """
-        print_counts: dict[tuple, int] = {}
+        print_counts: Counter[tuple] = Counter()
         print_objects: dict[tuple, Print] = {}
+        last_item: Print | None = None
+        key: tuple = ()
 
         for print_item in stack:
-            # Create a key based on print properties, including all identity fields
-            key = (
-                print_item.name,
-                print_item.set,
-                print_item.foil,
-                print_item.price,
-                print_item.condition,
-                print_item.language,
-                print_item.collector_number,
-                tuple(print_item.tags) if print_item.tags else (),
-            )
-
-            print_counts[key] = print_counts.get(key, 0) + 1
-            print_objects[key] = print_item
+            # Copies parsed from one row share an instance and arrive together,
+            # so the key only needs rebuilding when the instance changes
+            if print_item is not last_item:
+                last_item = print_item
+                # Key on print properties, including all identity fields
+                key = (
+                    print_item.name,
+                    print_item.set,
+                    print_item.foil,
+                    print_item.price,
+                    print_item.condition,
+                    print_item.language,
+                    print_item.collector_number,
+                    tuple(print_item.tags) if print_item.tags else (),
+                )
+                print_objects[key] = print_item
+
+            print_counts[key] += 1
 
         # Convert back to Print objects with counts
         return {print_objects[key]: count for key, count in print_counts.items()}
@@ -496,7 +630,7 @@ class ScryfallCsvStackWriter(StackWriter):
             ValueError: If the stack is empty.
 
         """
-        if len(list(stack)) == 0:
+        if len(stack) == 0:
             msg = "Cannot write an empty stack"
             raise ValueError(msg)
 
@@ -1,8 +1,16 @@
 """Registry for file readers and writers with automatic source tracking."""
 
+from __future__ import annotations
+
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import IO
 
-from stacks.stack import Stack
+    from stacks.parsing.abstractions import StackReader
+    from stacks.stack import Stack
 
 reader_registry = {}
 writer_registry = {}
@@ -46,11 +54,58 @@ def register_writer(ext: str):
     return wrapper
 
 
-def load_stack_from_file(path: str) -> Stack:
+def _get_reader(ext: str) -> StackReader:
+    """Look up the reader registered for a file extension.
+
+    Args:
+        ext: File extension without the leading dot.
+
+    Returns:
+        The registered reader.
+
+    Raises:
+        ValueError: If the file format is not supported.
+
+    """
+    reader = reader_registry.get(ext)
+    if not reader:
+        msg = f"Unsupported input format: .{ext}"
+        raise ValueError(msg)
+    return reader
+
+
+def load_stack_from_fileobj(
+    file: IO,
+    ext: str,
+    source: Path | None = None,
+) -> Stack:
+    """Load a stack from an already open file-like object.
+
+    Args:
+        file: File-like object to read from.
+        ext: File extension (without the leading dot) selecting the reader.
+        source: Optional path to record as the source of every card.
+
+    Returns:
+        Stack read by the reader registered for ``ext``.
+
+    Raises:
+        ValueError: If the file format is not supported.
+
+    """
+    return _get_reader(ext).read_with_source(file, source)
+
+
+def load_stack_from_file(
+    path: str,
+    *,
+    _opener: Callable[..., IO] = open,
+) -> Stack:
     """Load a stack from a file with automatic source tracking.
 
     Args:
         path: Path to the file to load.
+        _opener: Callable used to open the file; tests inject a mock here.
 
     Returns:
         Stack with cards having their source property set.
@@ -62,11 +117,8 @@ def load_stack_from_file(path: str) -> Stack:
     path_obj = Path(path)
     # Remove the leading dot or use full name if no extension
     ext = path_obj.suffix[1:] if path_obj.suffix else path_obj.name
-    reader = reader_registry.get(ext)
-    if not reader:
-        msg = f"Unsupported input format: .{ext}"
-        raise ValueError(msg)
-    with path_obj.open(encoding="utf-8") as f:
+    reader = _get_reader(ext)
+    with _opener(path_obj, encoding="utf-8") as f:
         return reader.read_with_source(f, path_obj)
 
 
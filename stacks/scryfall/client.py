@@ -2,7 +2,19 @@
 
 from __future__ import annotations
 
-import requests
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+@cache
+def _requests() -> ModuleType:
+    """Import requests on first use to keep it off the startup path."""
+    import requests  # noqa: PLC0415 - deferred so CLI startup skips requests
+
+    return requests
 
 
 class ScryfallClient:
@@ -40,7 +52,7 @@ class ScryfallClient:
         else:
             url = f"{self.BASE_URL}/cards/named"
 
-        response = requests.get(url, params=params, timeout=self._TIMEOUT)
+        response = _requests().get(url, params=params, timeout=self._TIMEOUT)
         if response.status_code == self._SUCCESS_STATUS:
             return response.json()
         if response.status_code == self._NOT_FOUND_STATUS:
@@ -7,9 +7,9 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from stacks.cards.card import Card
     from stacks.scryfall.client import ScryfallClient
-    from stacks.stack import Stack
 
 from stacks.cards.scryfall_card import ScryfallCard
+from stacks.stack import Stack
 
 
 class Scryer:
@@ -68,13 +68,12 @@ class Scryer:
             Cards that cannot be found on Scryfall are skipped.
 
         """
-        from stacks.stack import Stack
-
         enriched_stack: Stack[ScryfallCard] = Stack()
 
-        for card in cards:
+        # Look up each unique card once and reuse the result for its copies
+        for card, count in cards.items():
             enriched_card = self.enrich(card, set_code)
             if enriched_card:
-                enriched_stack.add(enriched_card)
+                enriched_stack.add(enriched_card, count=count)
 
         return enriched_stack
@@ -28,18 +28,53 @@ class Stack(Generic[T]):
 
         """
         self._cards: dict[T, list[T]] = defaultdict(list)
+        self._version = 0
         if cards:
             for card in cards:
                 self.add(card)
 
-    def add(self, card: T) -> None:
-        """Add a card to the stack.
+    def add(self, card: T, count: int = 1) -> None:
+        """Add one or more copies of a card to the stack.
 
         Args:
             card: The card to add to the stack.
+            count: Number of copies to add; all copies share the given instance.
+
+        Raises:
+            ValueError: If count is less than 1.
+
+        """
+        if count < 1:
+            msg = f"Count must be at least 1, got {count}"
+            raise ValueError(msg)
+        if count == 1:
+            self._cards[card].append(card)
+        else:
+            self._cards[card].extend([card] * count)
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever cards are added or retagged.
+
+        Returns:
+            The current modification count of the stack.
+
+        """
+        return self._version
+
+    def copy(self) -> Stack[T]:
+        """Return an independent stack holding the same card copies.
+
+        Returns:
+            A new Stack with its own copy lists.
 
         """
-        self._cards[card].append(card)
+        result: Stack[T] = Stack()
+        for card, copies in self._cards.items():
+            if copies:
+                result._cards[card] = copies.copy()
+        return result
 
     def count(self, card: T) -> int:
         """Get the count of copies of a specific card.
@@ -106,7 +141,7 @@ class Stack(Generic[T]):
             int: The number of elements contained in the stack.
 
         """
-        return sum(len(copies) for copies in self._cards.values())
+        return sum(map(len, self._cards.values()))
 
     def __bool__(self) -> bool:
         """Return True if the stack contains at least one item, otherwise False.
@@ -163,9 +198,11 @@ class Stack(Generic[T]):
 
     def union(self, other: Stack) -> Stack:
         """Get the union of this stack with another stack."""
-        result = Stack(self)  # Copy of self
-        for card in other:
-            result.add(card)
+        # Merge the copy lists per unique card instead of re-adding every copy
+        result: Stack = self.copy()
+        for card, copies in other._cards.items():
+            if copies:
+                result._cards[card].extend(copies)
         return result
 
     def add_tag(self, tag: str) -> None:
@@ -195,6 +232,7 @@ class Stack(Generic[T]):
 
         # Replace the cards dictionary
         self._cards = new_cards
+        self._version += 1
 
     def __str__(self) -> str:
         """Return a string representation of the stack.
@@ -1,11 +1,26 @@
 """Pytest configuration and shared fixtures."""
 
+from collections.abc import Callable
+from functools import cache
+
 import pytest
 
 from stacks.cards.card import Card
 from stacks.cards.print import Print
 
 
+@cache
+def _cached_card(name: str) -> Card:
+    """Build a Card once per name; cards are frozen so sharing is safe."""
+    return Card(name=name)
+
+
+@pytest.fixture(scope="session")
+def make_card() -> Callable[[str], Card]:
+    """Fixture providing a memoized Card factory keyed by card name."""
+    return _cached_card
+
+
 @pytest.fixture
 def sample_card() -> Card:
     """Fixture providing a sample Card instance."""
@@ -1,7 +1,11 @@
 """Tests for Arena deck file writer."""
 
-import tempfile
+from collections.abc import Callable
+from io import StringIO
 from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
 
 from stacks.cards.card import Card
 from stacks.parsing.arena import (
@@ -12,94 +16,81 @@ from stacks.parsing.arena import (
 )
 from stacks.stack import Stack
 
+_EXPECTED_SIMPLE = (
+    "Deck\n2 Counterspell\n1 Island\n4 Lightning Bolt\n2 Mountain\n\nSideboard\n"
+)
+_EXPECTED_EMPTY = "Deck\n\nSideboard\n"
+_EXPECTED_SORTED = ["2 Alpha", "1 Beta", "1 Zebra"]
+
+
+@pytest.fixture(scope="class")
+def simple_stack(make_card: Callable[[str], Card]) -> Stack:
+    """Fixture providing the nine-card deck shared by the writer tests."""
+    names = (
+        ["Lightning Bolt"] * 4 + ["Counterspell"] * 2 + ["Island"] + ["Mountain"] * 2
+    )
+    return Stack(make_card(name) for name in names)
+
+
+@pytest.fixture(scope="class")
+def power_stack(make_card: Callable[[str], Card]) -> Stack:
+    """Fixture providing a small deck with one duplicated card."""
+    names = ["Ancestral Recall", "Black Lotus", "Black Lotus"]
+    return Stack(make_card(name) for name in names)
+
+
+@pytest.fixture(scope="class")
+def sorting_stack(make_card: Callable[[str], Card]) -> Stack:
+    """Fixture providing cards added out of alphabetical order."""
+    # Alpha is duplicated to check counts survive the sort
+    return Stack(make_card(name) for name in ["Zebra", "Alpha", "Beta", "Alpha"])
+
 
 class TestArenaStackWriter:
     """Test cases for ArenaStackWriter."""
 
-    def test_write_simple_deck(self):
+    def test_write_simple_deck(self, simple_stack: Stack) -> None:
         """Test writing a simple deck."""
-        cards = [
-            Card(name="Lightning Bolt"),
-            Card(name="Lightning Bolt"),
-            Card(name="Lightning Bolt"),
-            Card(name="Lightning Bolt"),
-            Card(name="Counterspell"),
-            Card(name="Counterspell"),
-            Card(name="Island"),
-            Card(name="Mountain"),
-            Card(name="Mountain"),
-        ]
-
-        stack = Stack(cards)
         writer = ArenaStackWriter()
 
-        with tempfile.NamedTemporaryFile(mode="w+", suffix=".arena", delete=False) as f:
-            writer.write(stack, f)
-            f.flush()
-
-            # Read back the written content
-            with open(f.name, encoding="utf-8") as read_file:
-                content = read_file.read()
-
-        expected_lines = [
-            "Deck",
-            "2 Counterspell",
-            "1 Island",
-            "4 Lightning Bolt",
-            "2 Mountain",
-            "",
-            "Sideboard",
-            "",
-        ]
-        expected_content = "\n".join(expected_lines)
+        output = StringIO()
+        writer.write(simple_stack, output)
+        content = output.getvalue()
 
-        assert content == expected_content
+        assert content == _EXPECTED_SIMPLE
 
-        # Clean up
-        Path(f.name).unlink()
-
-    def test_write_empty_deck(self):
+    def test_write_empty_deck(self) -> None:
         """Test writing an empty deck."""
-        stack = Stack()
-        writer = ArenaStackWriter()
-
-        with tempfile.NamedTemporaryFile(mode="w+", suffix=".arena", delete=False) as f:
-            writer.write(stack, f)
-            f.flush()
+        output = StringIO()
+        ArenaStackWriter().write(Stack(), output)
+        assert output.getvalue() == _EXPECTED_EMPTY
 
-            # Read back the written content
-            with open(f.name, encoding="utf-8") as read_file:
-                content = read_file.read()
+    def test_write_issues_single_write(self) -> None:
+        """Test that the writer emits the whole deck in one write call."""
+        stack = Stack([Card(name="Forest"), Card(name="Island")])
+        output = Mock()
 
-        expected_content = "Deck\n\nSideboard\n"
-        assert content == expected_content
+        ArenaStackWriter().write(stack, output)
 
-        # Clean up
-        Path(f.name).unlink()
+        output.write.assert_called_once_with(
+            "Deck\n1 Forest\n1 Island\n\nSideboard\n",
+        )
 
-    def test_format_arena_deck_content(self):
+    def test_format_arena_deck_content(self, power_stack: Stack) -> None:
         """Test the format_arena_deck_content utility function."""
-        cards = [
-            Card(name="Ancestral Recall"),
-            Card(name="Black Lotus"),
-            Card(name="Black Lotus"),
-        ]
-
-        stack = Stack(cards)
-        content = format_arena_deck_content(stack)
+        content = format_arena_deck_content(power_stack)
 
         expected_content = "Deck\n1 Ancestral Recall\n2 Black Lotus\n\nSideboard\n"
         assert content == expected_content
 
-    def test_format_empty_deck_content(self):
+    def test_format_empty_deck_content(self) -> None:
         """Test formatting an empty deck."""
         stack = Stack()
         content = format_arena_deck_content(stack)
 
-        expected_content = "Deck\n\nSideboard\n"
-        assert content == expected_content
+        assert content == _EXPECTED_EMPTY
 
-    def test_write_arena_deck_file(self):
+    def test_write_arena_deck_file(self, tmp_path: Path) -> None:
         """Test the write_arena_deck_file utility function."""
         cards = [
             Card(name="Forest"),
@@ -109,24 +100,16 @@ class TestArenaStackWriter:
 
         stack = Stack(cards)
 
-        with tempfile.NamedTemporaryFile(suffix=".arena", delete=False) as f:
-            temp_path = Path(f.name)
-
-        try:
-            write_arena_deck_file(stack, temp_path)
+        temp_path = tmp_path / "out.arena"
+        write_arena_deck_file(stack, temp_path)
 
-            # Read back and verify
-            with temp_path.open(encoding="utf-8") as f:
-                content = f.read()
+        # Read back and verify
+        content = temp_path.read_text(encoding="utf-8")
 
-            expected_content = "Deck\n2 Forest\n1 Llanowar Elves\n\nSideboard\n"
-            assert content == expected_content
-
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+        expected_content = "Deck\n2 Forest\n1 Llanowar Elves\n\nSideboard\n"
+        assert content == expected_content
 
-    def test_roundtrip_consistency(self):
+    def test_roundtrip_consistency(self) -> None:
         """Test that reading and writing maintains consistency."""
         # Original Arena content
         original_content = """Deck
@@ -138,37 +121,15 @@ class TestArenaStackWriter:
 Sideboard
 """
 
-        # Parse the content
-        stack = parse_arena_deck_content(original_content)
+        # Parse the content and write it back in canonical form
+        content = format_arena_deck_content(parse_arena_deck_content(original_content))
 
-        # Write it back
-        new_content = format_arena_deck_content(stack)
+        # The canonical form must survive another roundtrip unchanged
+        assert format_arena_deck_content(parse_arena_deck_content(content)) == content
 
-        # Parse the new content
-        new_stack = parse_arena_deck_content(new_content)
-
-        # Verify both stacks have the same cards
-        original_counts = {}
-        for card in stack:
-            original_counts[card.name] = original_counts.get(card.name, 0) + 1
-
-        new_counts = {}
-        for card in new_stack:
-            new_counts[card.name] = new_counts.get(card.name, 0) + 1
-
-        assert original_counts == new_counts
-
-    def test_card_sorting(self):
+    def test_card_sorting(self, sorting_stack: Stack) -> None:
         """Test that cards are sorted alphabetically in output."""
-        cards = [
-            Card(name="Zebra"),
-            Card(name="Alpha"),
-            Card(name="Beta"),
-            Card(name="Alpha"),  # Duplicate
-        ]
-
-        stack = Stack(cards)
-        content = format_arena_deck_content(stack)
+        content = format_arena_deck_content(sorting_stack)
 
         lines = content.strip().split("\n")
         card_lines = [
@@ -176,4 +137,4 @@ Sideboard
         ]
 
         # Verify alphabetical order
-        assert card_lines == ["2 Alpha", "1 Beta", "1 Zebra"]
+        assert card_lines == _EXPECTED_SORTED
@@ -1,5 +1,7 @@
 """Tests for the Card class."""
 
+from pathlib import Path
+
 import pytest
 from pydantic import ValidationError
 
@@ -164,50 +166,35 @@ class TestCard:
         card = Card.model_validate(data)
         assert card.name == "Lightning Bolt"
 
-    def test_card_slug_basic(self) -> None:
-        """Test that the slug field is computed correctly for basic names."""
-        card = Card(name="Lightning Bolt")
-        assert card.slug == "lightning-bolt"
-
-    def test_card_slug_with_special_characters(self) -> None:
-        """Test slug computation with special characters and punctuation."""
-        card = Card(name="Sol Ring!")
-        assert card.slug == "sol-ring"
-
-    def test_card_slug_with_numbers(self) -> None:
-        """Test slug computation with numbers in the name."""
-        card = Card(name="Force of Will 5")
-        assert card.slug == "force-of-will-5"
-
-    def test_card_slug_with_apostrophes(self) -> None:
-        """Test slug computation with apostrophes."""
-        card = Card(name="Jace's Ingenuity")
-        assert card.slug == "jace-s-ingenuity"
-
-    def test_card_slug_with_unicode_characters(self) -> None:
-        """Test slug computation with unicode characters."""
-        card = Card(name="Æther Vial")
-        assert card.slug == "aether-vial"
-
-    def test_card_slug_with_multiple_spaces(self) -> None:
-        """Test slug computation with multiple spaces."""
-        card = Card(name="Lightning    Bolt")
-        assert card.slug == "lightning-bolt"
-
-    def test_card_slug_with_mixed_case(self) -> None:
-        """Test slug computation preserves lowercase conversion."""
-        card = Card(name="COUNTERSPELL")
-        assert card.slug == "counterspell"
-
-    def test_card_slug_with_commas_and_periods(self) -> None:
-        """Test slug computation with commas and periods."""
-        card = Card(name="Serra Angel, the Protector")
-        assert card.slug == "serra-angel-the-protector"
-
-    def test_card_slug_with_parentheses(self) -> None:
-        """Test slug computation with parentheses."""
-        card = Card(name="Lightning Bolt (Revised)")
-        assert card.slug == "lightning-bolt-revised"
+    @pytest.mark.parametrize(
+        ("name", "slug"),
+        [
+            ("Lightning Bolt", "lightning-bolt"),
+            ("Sol Ring!", "sol-ring"),
+            ("Force of Will 5", "force-of-will-5"),
+            ("Jace's Ingenuity", "jace-s-ingenuity"),
+            ("Æther Vial", "aether-vial"),
+            ("Lightning    Bolt", "lightning-bolt"),
+            ("COUNTERSPELL", "counterspell"),
+            ("Serra Angel, the Protector", "serra-angel-the-protector"),
+            ("Lightning Bolt (Revised)", "lightning-bolt-revised"),
+        ],
+        ids=[
+            "basic",
+            "special_characters",
+            "numbers",
+            "apostrophes",
+            "unicode_characters",
+            "multiple_spaces",
+            "mixed_case",
+            "commas_and_periods",
+            "parentheses",
+        ],
+    )
+    def test_card_slug(self, name: str, slug: str) -> None:
+        """Test that the slug field is computed correctly from the name."""
+        card = Card(name=name)
+        assert card.slug == slug
 
     def test_card_slug_included_in_model_dump(self) -> None:
         """Test that slug is included when dumping the model."""
@@ -236,6 +223,16 @@ class TestCard:
         assert card.slug == original_slug
 
 
+@pytest.fixture(scope="class")
+def lb_triplet() -> tuple[Card, Card, Card]:
+    """Fixture providing the same card read from two decks and from no source."""
+    return (
+        Card(name="Lightning Bolt", source="/path/to/deck1.txt"),  # type: ignore[arg-type]
+        Card(name="Lightning Bolt", source="/path/to/deck2.txt"),  # type: ignore[arg-type]
+        Card(name="Lightning Bolt", source=None),
+    )
+
+
 class TestCardSource:
     """Test cases for the Card source property."""
 
@@ -249,43 +246,28 @@ class TestCardSource:
         card = Card(name="Lightning Bolt", source=None)
         assert card.source is None
 
-    def test_card_creation_with_source_string(self) -> None:
-        """Test creating a card with string source path."""
-        from pathlib import Path
-
-        card = Card(name="Lightning Bolt", source="/path/to/deck.txt")  # type: ignore[arg-type]
-        assert card.source == Path("/path/to/deck.txt")
-        assert isinstance(card.source, Path)
-
-    def test_card_creation_with_source_path_object(self) -> None:
-        """Test creating a card with Path object source."""
-        from pathlib import Path
-
-        source_path = Path("/path/to/deck.txt")
-        card = Card(name="Lightning Bolt", source=source_path)
-        assert card.source == source_path
-        assert isinstance(card.source, Path)
-
-    def test_card_creation_with_relative_path_string(self) -> None:
-        """Test creating a card with relative path string."""
-        from pathlib import Path
-
-        card = Card(name="Lightning Bolt", source="deck.txt")  # type: ignore[arg-type]
-        assert card.source == Path("deck.txt")
-        assert isinstance(card.source, Path)
-
-    def test_card_creation_with_empty_string_source(self) -> None:
-        """Test creating a card with empty string source."""
-        from pathlib import Path
-
-        card = Card(name="Lightning Bolt", source="")  # type: ignore[arg-type]
-        assert card.source == Path()
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [
+            ("/path/to/deck.txt", Path("/path/to/deck.txt")),
+            (Path("/path/to/deck.txt"), Path("/path/to/deck.txt")),
+            ("deck.txt", Path("deck.txt")),
+            ("", Path()),
+        ],
+        ids=["string", "path_object", "relative_path_string", "empty_string"],
+    )
+    def test_card_creation_with_source(
+        self,
+        source: str | Path,
+        expected: Path,
+    ) -> None:
+        """Test that string and Path sources are stored as Path objects."""
+        card = Card(name="Lightning Bolt", source=source)  # type: ignore[arg-type]
+        assert card.source == expected
         assert isinstance(card.source, Path)
 
     def test_card_model_dump_with_source(self) -> None:
         """Test serializing a card with source to dictionary."""
-        from pathlib import Path
-
         card = Card(name="Lightning Bolt", source="/path/to/deck.txt")  # type: ignore[arg-type]
         data = card.model_dump()
         expected = {
@@ -310,8 +292,6 @@ class TestCardSource:
 
     def test_card_model_validate_with_source_string(self) -> None:
         """Test creating a card from dictionary with string source."""
-        from pathlib import Path
-
         data = {"name": "Lightning Bolt", "source": "/path/to/deck.txt"}
         card = Card.model_validate(data)
         assert card.name == "Lightning Bolt"
@@ -324,22 +304,24 @@ class TestCardSource:
         assert card.name == "Lightning Bolt"
         assert card.source is None
 
-    def test_card_equality_ignores_source(self) -> None:
+    def test_card_equality_ignores_source(
+        self,
+        lb_triplet: tuple[Card, Card, Card],
+    ) -> None:
         """Test that card equality is based on name only, not source."""
-        card1 = Card(name="Lightning Bolt", source="/path/to/deck1.txt")  # type: ignore[arg-type]
-        card2 = Card(name="Lightning Bolt", source="/path/to/deck2.txt")  # type: ignore[arg-type]
-        card3 = Card(name="Lightning Bolt", source=None)
+        card1, card2, card3 = lb_triplet
 
         # All should be equal since they have the same name
         assert card1 == card2
         assert card1 == card3
         assert card2 == card3
 
-    def test_card_hash_ignores_source(self) -> None:
+    def test_card_hash_ignores_source(
+        self,
+        lb_triplet: tuple[Card, Card, Card],
+    ) -> None:
         """Test that card hash is based on name only, not source."""
-        card1 = Card(name="Lightning Bolt", source="/path/to/deck1.txt")  # type: ignore[arg-type]
-        card2 = Card(name="Lightning Bolt", source="/path/to/deck2.txt")  # type: ignore[arg-type]
-        card3 = Card(name="Lightning Bolt", source=None)
+        card1, card2, card3 = lb_triplet
 
         # All should have the same hash since they have the same name
         assert hash(card1) == hash(card2)
@@ -348,8 +330,6 @@ class TestCardSource:
 
     def test_card_source_immutability(self) -> None:
         """Test that card source cannot be modified after creation."""
-        from pathlib import Path
-
         card = Card(name="Lightning Bolt", source="/path/to/deck.txt")  # type: ignore[arg-type]
         original_source = card.source
 
@@ -362,21 +342,24 @@ class TestCardSource:
         error_msg = str(exc_info.value).lower()
         assert "frozen" in error_msg or "immutable" in error_msg
 
-    def test_card_with_source_in_set(self) -> None:
+    def test_card_with_source_in_set(
+        self,
+        lb_triplet: tuple[Card, Card, Card],
+    ) -> None:
         """Test that cards with sources can be used in sets properly."""
-        card1 = Card(name="Lightning Bolt", source="/path/to/deck1.txt")  # type: ignore[arg-type]
-        card2 = Card(name="Lightning Bolt", source="/path/to/deck2.txt")  # type: ignore[arg-type]
+        card1, card2, _ = lb_triplet
         card3 = Card(name="Counterspell", source="/path/to/deck1.txt")  # type: ignore[arg-type]
 
         card_set = {card1, card2, card3}
         # card1 and card2 should be treated as the same card
         assert len(card_set) == 2
 
-    def test_card_identity_ignores_source(self) -> None:
+    def test_card_identity_ignores_source(
+        self,
+        lb_triplet: tuple[Card, Card, Card],
+    ) -> None:
         """Test that card identity is based on name only, not source."""
-        card1 = Card(name="Lightning Bolt", source="/path/to/deck1.txt")  # type: ignore[arg-type]
-        card2 = Card(name="Lightning Bolt", source="/path/to/deck2.txt")  # type: ignore[arg-type]
-        card3 = Card(name="Lightning Bolt", source=None)
+        card1, card2, card3 = lb_triplet
 
         # All should have the same identity
         assert card1.identity() == card2.identity()
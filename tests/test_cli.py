@@ -1,14 +1,23 @@
 """Tests for the CLI functionality."""
 
-import tempfile
+from collections import Counter
 from pathlib import Path
 
+import pytest
+
 from stacks.cards.card import Card
 from stacks.cards.print import Print
 from stacks.cli.converters import convert_to_print, normalize_stack_for_output
+from stacks.cli.operations import OPERATIONS, perform_stack_operation
 from stacks.stack import Stack
 
 
+@pytest.fixture(scope="module")
+def tmp_arena_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Fixture providing a temporary directory shared by the module's tests."""
+    return tmp_path_factory.mktemp("arena")
+
+
 def test_convert_to_print() -> None:
     """Test converting Card to Print."""
     # Test with existing Print object
@@ -47,8 +56,6 @@ def test_normalize_stack_for_output() -> None:
 
 def test_cli_operations_basic() -> None:
     """Test basic CLI operations work."""
-    from stacks.cli.operations import OPERATIONS
-
     # Test that all expected operations are available
     expected_ops = {"difference", "union", "intersection"}
     assert set(OPERATIONS.keys()) == expected_ops
@@ -59,49 +66,50 @@ def test_cli_operations_basic() -> None:
 
     # Test union
     union_result = OPERATIONS["union"].execute(stack1, stack2)
-    union_cards = [card.name for card in union_result]
-    assert sorted(union_cards) == ["A", "B", "B", "C"]
+    union_cards = Counter(card.name for card in union_result)
+    assert union_cards == Counter({"A": 1, "B": 2, "C": 1})
 
     # Test intersection
     intersect_result = OPERATIONS["intersection"].execute(stack1, stack2)
-    intersect_cards = [card.name for card in intersect_result]
-    assert intersect_cards == ["B"]
+    intersect_cards = Counter(card.name for card in intersect_result)
+    assert intersect_cards == Counter({"B": 1})
 
     # Test difference
     diff_result = OPERATIONS["difference"].execute(stack1, stack2)
-    diff_cards = [card.name for card in diff_result]
-    assert diff_cards == ["A"]
+    diff_cards = Counter(card.name for card in diff_result)
+    assert diff_cards == Counter({"A": 1})
 
 
-def test_cli_with_files() -> None:
+def test_cli_with_files(tmp_arena_dir: Path) -> None:
     """Test CLI with actual files."""
-    from stacks.cli.operations import perform_stack_operation
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Create test arena files
-        deck1_path = tmppath / "deck1.arena"
-        deck1_path.write_text("Deck\n2 Lightning Bolt\n1 Island\n\nSideboard\n")
-
-        deck2_path = tmppath / "deck2.arena"
-        deck2_path.write_text("Deck\n1 Lightning Bolt\n2 Forest\n\nSideboard\n")
-
-        output_path = tmppath / "result.arena"
-
-        # Test union operation
-        perform_stack_operation(
-            "union",
-            str(deck1_path),
-            str(deck2_path),
-            str(output_path),
-        )
-
-        # Verify output file was created and has expected content
-        assert output_path.exists()
-        content = output_path.read_text()
-
-        # Should have 3 Lightning Bolt (2+1), 1 Island, 2 Forest
-        assert "3 Lightning Bolt" in content
-        assert "1 Island" in content
-        assert "2 Forest" in content
+    # Create test arena files
+    deck1_path = tmp_arena_dir / "deck1.arena"
+    deck1_path.write_text(
+        "Deck\n2 Lightning Bolt\n1 Island\n\nSideboard\n",
+        encoding="utf-8",
+    )
+
+    deck2_path = tmp_arena_dir / "deck2.arena"
+    deck2_path.write_text(
+        "Deck\n1 Lightning Bolt\n2 Forest\n\nSideboard\n",
+        encoding="utf-8",
+    )
+
+    output_path = tmp_arena_dir / "result.arena"
+
+    # Test union operation
+    perform_stack_operation(
+        "union",
+        str(deck1_path),
+        str(deck2_path),
+        str(output_path),
+    )
+
+    # Verify output file was created and has expected content
+    assert output_path.exists()
+    content = output_path.read_bytes().decode("utf-8")
+
+    # Should have 3 Lightning Bolt (2+1), 1 Island, 2 Forest
+    assert "3 Lightning Bolt" in content
+    assert "1 Island" in content
+    assert "2 Forest" in content
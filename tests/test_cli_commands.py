@@ -2,95 +2,80 @@
 
 from __future__ import annotations
 
-import tempfile
+import os
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, NonCallableMagicMock, patch, sentinel
 
+import click
+import pytest
 from click.testing import CliRunner
 
-
-class TestDifferenceCommand:
-    """Test cases for the difference command."""
-
-    @patch("stacks.cli.commands.perform_stack_operation")
-    def test_difference_command_calls_operation(self, mock_perform: Mock) -> None:
-        """Test that difference command calls perform_stack_operation correctly."""
-        from stacks.cli.commands import difference
-
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            Path("deck1.arena").touch()
-            Path("deck2.arena").touch()
-
-            result = runner.invoke(
-                difference,
-                ["deck1.arena", "deck2.arena", "result.arena"],
-            )
-
-            assert result.exit_code == 0
-            mock_perform.assert_called_once_with(
-                "difference",
-                "deck1.arena",
-                "deck2.arena",
-                "result.arena",
-            )
-
-
-class TestUnionCommand:
-    """Test cases for the union command."""
-
+from stacks.cli.commands import (
+    _convert_filter_value,
+    _parse_convenience_filters,
+    _parse_generic_filters,
+    _write_filtered_result,
+    difference,
+    enrich,
+    filter_stack,
+    intersection,
+    list_operations,
+    union,
+)
+
+# Stand-in cards are only counted, so every test can iterate the same mocks
+_FIVE_MOCKS = [NonCallableMagicMock() for _ in range(5)]
+_FOUR_MOCKS = [NonCallableMagicMock() for _ in range(4)]
+
+_SET_OPERATION_ARGS = ("deck1.arena", "deck2.arena", "result.arena")
+
+
+def make_stack_mock(cards: list[NonCallableMagicMock]) -> NonCallableMagicMock:
+    """Create a stack stand-in that iterates over and counts the given cards."""
+    mock_stack = NonCallableMagicMock()
+    mock_stack.__iter__.return_value = iter(cards)
+    mock_stack.__len__.return_value = len(cards)
+    return mock_stack
+
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """Fixture providing a CLI runner shared by the module's tests."""
+    return CliRunner()
+
+
+@pytest.fixture
+def unchecked_paths(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fixture letting click.Path arguments through without touching the disk."""
+    monkeypatch.setattr(click.Path, "convert", lambda _self, value, *_: value)
+
+
+@pytest.mark.usefixtures("unchecked_paths")
+class TestSetOperationCommands:
+    """Test cases for the difference, union, and intersection commands."""
+
+    @pytest.mark.parametrize(
+        ("command", "operation"),
+        [
+            (difference, "difference"),
+            (union, "union"),
+            (intersection, "intersection"),
+        ],
+    )
     @patch("stacks.cli.commands.perform_stack_operation")
-    def test_union_command_calls_operation(self, mock_perform: Mock) -> None:
-        """Test that union command calls perform_stack_operation correctly."""
-        from stacks.cli.commands import union
-
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            Path("deck1.arena").touch()
-            Path("deck2.arena").touch()
-
-            result = runner.invoke(
-                union,
-                ["deck1.arena", "deck2.arena", "result.arena"],
-            )
-
-            assert result.exit_code == 0
-            mock_perform.assert_called_once_with(
-                "union",
-                "deck1.arena",
-                "deck2.arena",
-                "result.arena",
-            )
-
-
-class TestIntersectionCommand:
-    """Test cases for the intersection command."""
-
-    @patch("stacks.cli.commands.perform_stack_operation")
-    def test_intersection_command_calls_operation(
+    def test_command_calls_operation(
         self,
         mock_perform: Mock,
+        command: click.Command,
+        operation: str,
+        runner: CliRunner,
     ) -> None:
-        """Test that intersection command calls perform_stack_operation correctly."""
-        from stacks.cli.commands import intersection
-
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            Path("deck1.arena").touch()
-            Path("deck2.arena").touch()
-
-            result = runner.invoke(
-                intersection,
-                ["deck1.arena", "deck2.arena", "result.arena"],
-            )
+        """Test that each command calls perform_stack_operation correctly."""
+        result = runner.invoke(command, _SET_OPERATION_ARGS)
 
-            assert result.exit_code == 0
-            mock_perform.assert_called_once_with(
-                "intersection",
-                "deck1.arena",
-                "deck2.arena",
-                "result.arena",
-            )
+        assert result.exit_code == 0
+        mock_perform.assert_called_once_with(operation, *_SET_OPERATION_ARGS)
 
 
 class TestListOperationsCommand:
@@ -102,17 +87,15 @@ class TestListOperationsCommand:
         self,
         mock_echo: Mock,
         mock_operations: Mock,
+        runner: CliRunner,
     ) -> None:
         """Test that list_operations displays all available operations."""
-        from stacks.cli.commands import list_operations
-
         # Mock operations
         mock_operations.items.return_value = [
             ("op1", Mock(description="First operation")),
             ("op2", Mock(description="Second operation")),
         ]
 
-        runner = CliRunner()
         result = runner.invoke(list_operations)
 
         assert result.exit_code == 0
@@ -123,128 +106,119 @@ class TestListOperationsCommand:
 class TestEnrichCommand:
     """Test cases for the enrich command."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+    @pytest.fixture(autouse=True)
+    def _input_file(self, tmp_path: Path) -> None:
+        """Set up test fixtures in a temporary directory."""
+        self.temp_dir = tmp_path
         self.input_file = self.temp_dir / "input.arena"
-        self.output_file = self.temp_dir / "output.csv"
+        # Writers are mocked, so the output never needs a real directory
+        self.output_file = Path(os.devnull)
         self.input_file.touch()
+        self.input_path_str = str(self.input_file)
+        self.output_path_str = str(self.output_file)
 
-    @patch("stacks.cli.commands.load_stack_from_file")
-    @patch("stacks.cli.commands.ScryfallClient")
-    @patch("stacks.cli.commands.Scryer")
-    @patch("stacks.parsing.csv.ScryfallCsvStackWriter")
     def test_enrich_command_success(
         self,
-        mock_writer_class: Mock,
-        mock_scryer_class: Mock,
-        mock_client_class: Mock,
-        mock_load_stack: Mock,
+        monkeypatch: pytest.MonkeyPatch,
+        runner: CliRunner,
     ) -> None:
         """Test successful enrichment command execution."""
-        from stacks.cli.commands import enrich
-
         # Setup mocks
-        mock_stack = Mock()
-        # Make the stack iterable and have a length
-        mock_cards = [Mock(), Mock(), Mock(), Mock(), Mock()]
-        mock_stack.__iter__ = Mock(return_value=iter(mock_cards))
-        mock_stack.__len__ = Mock(return_value=5)
-        mock_load_stack.return_value = mock_stack
-
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-
-        mock_scryer = Mock()
-        mock_scryer_class.return_value = mock_scryer
-
-        mock_enriched_stack = Mock()
-        # Make the enriched stack iterable and have a length
-        mock_enriched_cards = [Mock(), Mock(), Mock(), Mock()]
-        mock_enriched_stack.__iter__ = Mock(return_value=iter(mock_enriched_cards))
-        mock_enriched_stack.__len__ = Mock(return_value=4)
+        mock_stack = make_stack_mock(_FIVE_MOCKS)
+        mock_load_stack = Mock(return_value=mock_stack)
+
+        mock_client = NonCallableMagicMock()
+        mock_client_class = Mock(return_value=mock_client)
+
+        mock_scryer = NonCallableMagicMock()
+        mock_scryer_class = Mock(return_value=mock_scryer)
+
+        mock_enriched_stack = make_stack_mock(_FOUR_MOCKS)
         mock_scryer.enrich_stack.return_value = mock_enriched_stack
 
-        mock_writer = Mock()
-        mock_writer_class.return_value = mock_writer
+        mock_writer = NonCallableMagicMock()
+        mock_writer_class = Mock(return_value=mock_writer)
+
+        monkeypatch.setattr("stacks.cli.commands.load_stack_from_file", mock_load_stack)
+        monkeypatch.setattr("stacks.cli.commands.ScryfallClient", mock_client_class)
+        monkeypatch.setattr("stacks.cli.commands.Scryer", mock_scryer_class)
+        monkeypatch.setattr(
+            "stacks.parsing.csv.ScryfallCsvStackWriter",
+            mock_writer_class,
+        )
 
-        runner = CliRunner()
         result = runner.invoke(
             enrich,
-            [str(self.input_file), str(self.output_file)],
+            [self.input_path_str, self.output_path_str],
         )
 
         assert result.exit_code == 0
 
         # Verify function calls
-        mock_load_stack.assert_called_once_with(str(self.input_file))
+        mock_load_stack.assert_called_once_with(self.input_path_str)
         mock_client_class.assert_called_once()
         mock_scryer_class.assert_called_once_with(mock_client)
         mock_scryer.enrich_stack.assert_called_once_with(mock_stack, None)
         # Just verify that write was called, don't check the exact file handle
         mock_writer.write.assert_called_once()
 
-    def test_enrich_command_file_not_exists(self) -> None:
-        """Test enrich command with non-existent input file."""
-        from stacks.cli.commands import enrich
 
-        runner = CliRunner()
-        result = runner.invoke(
-            enrich,
-            ["non_existent.arena", str(self.output_file)],
-        )
+def test_enrich_command_file_not_exists(runner: CliRunner) -> None:
+    """Test enrich command with non-existent input file."""
+    # click.Path(exists=True) rejects the input before the command body runs
+    result = runner.invoke(enrich, ["/nonexistent/input.arena", os.devnull])
 
-        assert result.exit_code != 0
+    assert result.exit_code != 0
 
 
 class TestFilterStackCommand:
     """Test cases for the filter_stack command."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+    @pytest.fixture(autouse=True)
+    def _input_file(self, tmp_path: Path) -> None:
+        """Set up test fixtures in a temporary directory."""
+        self.temp_dir = tmp_path
         self.input_file = self.temp_dir / "input.csv"
-        self.output_file = self.temp_dir / "output.csv"
+        # Writers are mocked, so the output never needs a real directory
+        self.output_file = Path(os.devnull)
         self.input_file.touch()
+        self.input_path_str = str(self.input_file)
+        self.output_path_str = str(self.output_file)
 
-    @patch("stacks.cli.commands.load_stack_from_file")
-    @patch("stacks.filtering.FilterableStack")
-    @patch("stacks.cli.commands._write_filtered_result")
     def test_filter_stack_basic(
         self,
-        mock_write_result: Mock,
-        mock_filterable_class: Mock,
-        mock_load_stack: Mock,
+        monkeypatch: pytest.MonkeyPatch,
+        runner: CliRunner,
     ) -> None:
         """Test basic filter_stack command execution."""
-        from stacks.cli.commands import filter_stack
-
         # Setup mocks
-        mock_stack = Mock()
-        # Make the stack iterable for len() calls
-        mock_cards = [Mock(), Mock(), Mock()]
-        mock_stack.__iter__ = Mock(return_value=iter(mock_cards))
-        mock_load_stack.return_value = mock_stack
-
-        mock_filterable = Mock()
-        mock_filterable_class.return_value = mock_filterable
-
-        mock_filtered_stack = Mock()
-        # Make the filtered stack iterable for len() calls
-        filtered_cards = [Mock(), Mock()]
-        mock_filtered_stack.__iter__ = Mock(return_value=iter(filtered_cards))
+        mock_stack = make_stack_mock(_FIVE_MOCKS[:3])
+        mock_load_stack = Mock(return_value=mock_stack)
+
+        mock_filterable = NonCallableMagicMock()
+        mock_filterable_class = Mock(return_value=mock_filterable)
+
+        mock_filtered_stack = make_stack_mock(_FOUR_MOCKS[:2])
         mock_filterable.filter.return_value = mock_filtered_stack
 
-        runner = CliRunner()
+        mock_write_result = Mock()
+
+        monkeypatch.setattr("stacks.cli.commands.load_stack_from_file", mock_load_stack)
+        monkeypatch.setattr("stacks.filtering.FilterableStack", mock_filterable_class)
+        monkeypatch.setattr(
+            "stacks.cli.commands._write_filtered_result",
+            mock_write_result,
+        )
+
         result = runner.invoke(
             filter_stack,
-            [str(self.input_file), str(self.output_file)],
+            [self.input_path_str, self.output_path_str],
         )
 
         assert result.exit_code == 0
 
         # Verify function calls
-        mock_load_stack.assert_called_once_with(str(self.input_file))
+        mock_load_stack.assert_called_once_with(self.input_path_str)
         mock_filterable_class.assert_called_once_with(mock_stack)
         mock_write_result.assert_called_once()
 
@@ -254,8 +228,6 @@ class TestParseGenericFilters:
 
     def test_parse_valid_filters(self) -> None:
         """Test parsing valid filter strings."""
-        from stacks.cli.commands import _parse_generic_filters
-
         filters = ("name:eq:Lightning Bolt", "price_usd:gte:10.0")
 
         result = _parse_generic_filters(filters)
@@ -267,8 +239,6 @@ class TestParseGenericFilters:
 
     def test_parse_price_filter(self) -> None:
         """Test parsing price filter with float conversion."""
-        from stacks.cli.commands import _parse_generic_filters
-
         filters = ("price_usd:gte:15.99",)
 
         result = _parse_generic_filters(filters)
@@ -281,51 +251,31 @@ class TestParseGenericFilters:
 class TestConvertFilterValue:
     """Test cases for _convert_filter_value helper function."""
 
-    def test_convert_price_value(self) -> None:
-        """Test converting price values."""
-        from stacks.cli.commands import _convert_filter_value
-
-        invalid_filters: list[str] = []
-
-        # Valid float
-        result = _convert_filter_value(
-            "price_usd",
-            "15.99",
-            "price_usd:gte:15.99",
-            invalid_filters,
-        )
-        assert result == 15.99
-        assert len(invalid_filters) == 0
-
-        # Null value
-        result = _convert_filter_value(
-            "price_usd",
-            "null",
-            "price_usd:eq:null",
-            invalid_filters,
-        )
-        assert result is None
-        assert len(invalid_filters) == 0
-
-    def test_convert_colors_value(self) -> None:
-        """Test converting colors values."""
-        from stacks.cli.commands import _convert_filter_value
-
+    @pytest.mark.parametrize(
+        ("prop", "value", "filter_str", "expected"),
+        [
+            ("price_usd", "15.99", "price_usd:gte:15.99", 15.99),
+            ("price_usd", "null", "price_usd:eq:null", None),
+            ("colors", "R,G,B", "colors:in:R,G,B", {"R", "G", "B"}),
+        ],
+        ids=["price", "null_price", "colors"],
+    )
+    def test_convert_valid_value(
+        self,
+        prop: str,
+        value: str,
+        filter_str: str,
+        expected: object,
+    ) -> None:
+        """Test converting valid filter values."""
         invalid_filters: list[str] = []
 
-        result = _convert_filter_value(
-            "colors",
-            "R,G,B",
-            "colors:in:R,G,B",
-            invalid_filters,
-        )
-        assert result == {"R", "G", "B"}
+        result = _convert_filter_value(prop, value, filter_str, invalid_filters)
+        assert result == expected
         assert len(invalid_filters) == 0
 
     def test_convert_invalid_price(self) -> None:
         """Test converting invalid price value."""
-        from stacks.cli.commands import _convert_filter_value
-
         invalid_filters: list[str] = []
 
         result = _convert_filter_value(
@@ -343,8 +293,6 @@ class TestParseConvenienceFilters:
 
     def test_parse_colors_filter(self) -> None:
         """Test parsing colors convenience filter."""
-        from stacks.cli.commands import _parse_convenience_filters
-
         kwargs = {"colors": "R,G,B"}
 
         result = _parse_convenience_filters(kwargs)
@@ -356,8 +304,6 @@ class TestParseConvenienceFilters:
 
     def test_parse_price_range_filters(self) -> None:
         """Test parsing price range convenience filters."""
-        from stacks.cli.commands import _parse_convenience_filters
-
         kwargs = {"price_min": 5.0, "price_max": 50.0}
 
         result = _parse_convenience_filters(kwargs)
@@ -366,8 +312,6 @@ class TestParseConvenienceFilters:
 
     def test_parse_empty_kwargs(self) -> None:
         """Test parsing empty kwargs."""
-        from stacks.cli.commands import _parse_convenience_filters
-
         result = _parse_convenience_filters({})
 
         assert len(result) == 0
@@ -384,18 +328,14 @@ class TestWriteFilteredResult:
         mock_write: Mock,
     ) -> None:
         """Test writing filtered result to file."""
-        from stacks.cli.commands import _write_filtered_result
-
-        mock_stack = Mock()
-        mock_normalized = Mock()
-        mock_normalize.return_value = mock_normalized
+        mock_normalize.return_value = sentinel.normalized
 
         output_path = Path("output.csv")
 
-        _write_filtered_result(mock_stack, output_path)
+        _write_filtered_result(sentinel.stack, output_path)
 
-        mock_normalize.assert_called_once_with(mock_stack, "csv")
-        mock_write.assert_called_once_with(mock_normalized, "output.csv")
+        mock_normalize.assert_called_once_with(sentinel.stack, "csv")
+        mock_write.assert_called_once_with(sentinel.normalized, "output.csv")
 
 
 class TestIntegration:
@@ -404,15 +344,13 @@ class TestIntegration:
     def setup_method(self) -> None:
         """Set up test fixtures."""
         self.cards = [
-            Mock(name="Lightning Bolt", colors={"R"}, rarity="common"),
-            Mock(name="Counterspell", colors={"U"}, rarity="common"),
-            Mock(name="Black Lotus", colors=set(), rarity="special"),
+            SimpleNamespace(name="Lightning Bolt", colors={"R"}, rarity="common"),
+            SimpleNamespace(name="Counterspell", colors={"U"}, rarity="common"),
+            SimpleNamespace(name="Black Lotus", colors=set(), rarity="special"),
         ]
 
     def test_filter_operations_basic(self) -> None:
         """Test basic filter operation functionality."""
-        from stacks.cli.commands import _parse_generic_filters
-
         # Test generic filter parsing
         filters = ("name:eq:Lightning Bolt", "rarity:eq:common")
         result = _parse_generic_filters(filters)
@@ -13,6 +13,121 @@ from stacks.filtering import (
 from stacks.stack import Stack
 
 
+class _RecordingFilter(CardPropertyFilter):
+    """CardPropertyFilter that records the name of every card it checks."""
+
+    def __init__(
+        self,
+        property_name: str,
+        operator: FilterOperator,
+        value: object,
+    ) -> None:
+        super().__init__(property_name, operator, value)
+        self.checked: list[str] = []
+
+    def apply(self, card: object) -> bool:
+        self.checked.append(card.name)  # type: ignore[attr-defined]
+        return super().apply(card)
+
+
+@pytest.fixture
+def stock_checked(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record the card names the stock CardPropertyFilter.apply checks."""
+    checked: list[str] = []
+    stock_apply = CardPropertyFilter.apply
+
+    def recording_apply(filter_obj: CardPropertyFilter, card: object) -> bool:
+        checked.append(card.name)  # type: ignore[attr-defined]
+        return stock_apply(filter_obj, card)
+
+    monkeypatch.setattr(CardPropertyFilter, "apply", recording_apply)
+    return checked
+
+
+@pytest.fixture(scope="module")
+def sample_cards() -> list[Card]:
+    """Fixture providing sample cards for testing."""
+    return [
+        Card(name="Lightning Bolt"),
+        Card(name="Counterspell"),
+        Card(name="Black Lotus"),
+    ]
+
+
+@pytest.fixture(scope="module")
+def sample_prints() -> list[Print]:
+    """Fixture providing sample prints for testing."""
+    return [
+        Print(
+            name="Lightning Bolt",
+            set="LEA",
+            foil=False,
+            condition="NM",
+            language="en",
+            price=15.99,
+        ),
+        Print(
+            name="Black Lotus",
+            set="LEA",
+            foil=True,
+            condition="NM",
+            language="en",
+            price=50000.0,
+        ),
+        Print(
+            name="Counterspell",
+            set="ICE",
+            foil=False,
+            condition="LP",
+            language="en",
+            price=2.50,
+        ),
+    ]
+
+
+@pytest.fixture(scope="module")
+def sample_stack() -> Stack[Print]:
+    """Fixture providing a sample stack of prints for testing."""
+    prints = [
+        Print(
+            name="Lightning Bolt",
+            set="LEA",
+            foil=False,
+            condition="NM",
+            language="en",
+            price=15.99,
+        ),
+        Print(
+            name="Black Lotus",
+            set="LEA",
+            foil=True,
+            condition="NM",
+            language="en",
+            price=50000.0,
+        ),
+        Print(
+            name="Counterspell",
+            set="ICE",
+            foil=False,
+            condition="LP",
+            language="en",
+            price=2.50,
+        ),
+        Print(
+            name="Lightning Bolt",
+            set="ICE",
+            foil=False,
+            condition="NM",
+            language="en",
+            price=12.99,
+        ),
+    ]
+    stack: Stack[Print] = Stack()
+    for print_card in prints:
+        stack.add(print_card)
+    return stack
+
+
 class TestFilterOperator:
     """Test cases for the FilterOperator enum."""
 
@@ -58,45 +173,6 @@ class TestPropertyFilter:
 class TestCardPropertyFilter:
     """Test cases for the CardPropertyFilter class."""
 
-    @pytest.fixture
-    def sample_cards(self) -> list[Card]:
-        """Fixture providing sample cards for testing."""
-        return [
-            Card(name="Lightning Bolt"),
-            Card(name="Counterspell"),
-            Card(name="Black Lotus"),
-        ]
-
-    @pytest.fixture
-    def sample_prints(self) -> list[Print]:
-        """Fixture providing sample prints for testing."""
-        return [
-            Print(
-                name="Lightning Bolt",
-                set="LEA",
-                foil=False,
-                condition="NM",
-                language="en",
-                price=15.99,
-            ),
-            Print(
-                name="Black Lotus",
-                set="LEA",
-                foil=True,
-                condition="NM",
-                language="en",
-                price=50000.0,
-            ),
-            Print(
-                name="Counterspell",
-                set="ICE",
-                foil=False,
-                condition="LP",
-                language="en",
-                price=2.50,
-            ),
-        ]
-
     def test_equals_operator_with_matching_card(
         self,
         sample_cards: list[Card],
@@ -230,6 +306,14 @@ class TestCardPropertyFilter:
         assert filter_obj.apply(sample_prints[0]) is True  # Lightning Bolt set LEA
         assert filter_obj.apply(sample_prints[2]) is True  # Counterspell set ICE
 
+    def test_in_operator_with_string_value_matches_substring(
+        self,
+        sample_prints: list[Print],
+    ) -> None:
+        """Test IN operator with a string value checks for a substring."""
+        filter_obj = CardPropertyFilter("set", FilterOperator.IN, "LEA,ICE")
+        assert filter_obj.apply(sample_prints[0]) is True  # Lightning Bolt set LEA
+
     def test_not_in_operator_with_list_values(
         self,
         sample_prints: list[Print],
@@ -312,52 +396,61 @@ class TestCardPropertyFilter:
         filter_obj.operator = "invalid_operator"  # type: ignore[assignment]
         assert filter_obj.apply(sample_cards[0]) is False
 
+    def test_reassigned_value_is_used_after_apply(
+        self,
+        sample_cards: list[Card],
+    ) -> None:
+        """Test that changing a filter after use takes effect on the next apply."""
+        filter_obj = CardPropertyFilter("name", FilterOperator.EQUALS, "Counterspell")
+        assert filter_obj.apply(sample_cards[0]) is False
+
+        filter_obj.value = "Lightning Bolt"
+        assert filter_obj.apply(sample_cards[0]) is True
+
+    def test_in_place_value_change_needs_reassignment(
+        self,
+        sample_cards: list[Card],
+    ) -> None:
+        """Test that an IN list edited in place is only seen once reassigned."""
+        filter_obj = CardPropertyFilter("name", FilterOperator.IN, ["Counterspell"])
+        assert filter_obj.apply(sample_cards[0]) is False
+
+        filter_obj.value.append("Lightning Bolt")  # type: ignore[attr-defined]
+        assert filter_obj.apply(sample_cards[0]) is False
+
+        filter_obj.value = filter_obj.value
+        assert filter_obj.apply(sample_cards[0]) is True
+
+    def test_contains_verdicts_follow_reassigned_value(
+        self,
+        sample_cards: list[Card],
+    ) -> None:
+        """Test that remembered CONTAINS results are dropped with the old value."""
+        filter_obj = CardPropertyFilter("name", FilterOperator.CONTAINS, "bolt")
+        assert filter_obj.apply(sample_cards[0]) is True
+        assert filter_obj.apply(sample_cards[0]) is True
+
+        filter_obj.value = "spell"
+        assert filter_obj.apply(sample_cards[0]) is False
+        assert filter_obj.apply(sample_cards[1]) is True
+
+    def test_contains_verdicts_stay_correct_past_cache_limit(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that evicting old CONTAINS verdicts keeps results correct."""
+        monkeypatch.setattr("stacks.filtering._VERDICT_CACHE_SIZE", 2)
+        filter_obj = CardPropertyFilter("name", FilterOperator.CONTAINS, "bolt")
+        names = ["Lightning Bolt", "Counterspell", "Bolt Bend", "Island"] * 2
+
+        verdicts = [filter_obj.apply(Card(name=name)) for name in names]
+
+        assert verdicts == [True, False, True, False] * 2
+
 
 class TestFilterableStack:
     """Test cases for the FilterableStack class."""
 
-    @pytest.fixture
-    def sample_stack(self) -> Stack[Print]:
-        """Fixture providing a sample stack of prints for testing."""
-        prints = [
-            Print(
-                name="Lightning Bolt",
-                set="LEA",
-                foil=False,
-                condition="NM",
-                language="en",
-                price=15.99,
-            ),
-            Print(
-                name="Black Lotus",
-                set="LEA",
-                foil=True,
-                condition="NM",
-                language="en",
-                price=50000.0,
-            ),
-            Print(
-                name="Counterspell",
-                set="ICE",
-                foil=False,
-                condition="LP",
-                language="en",
-                price=2.50,
-            ),
-            Print(
-                name="Lightning Bolt",
-                set="ICE",
-                foil=False,
-                condition="NM",
-                language="en",
-                price=12.99,
-            ),
-        ]
-        stack: Stack[Print] = Stack()
-        for print_card in prints:
-            stack.add(print_card)
-        return stack
-
     def test_filterable_stack_initialization(
         self,
         sample_stack: Stack[Print],
@@ -405,6 +498,54 @@ class TestFilterableStack:
         assert isinstance(filtered_cards[0], Print)
         assert filtered_cards[0].set == "LEA"
 
+    def test_shared_copies_are_checked_once(self, stock_checked: list[str]) -> None:
+        """Test that copies sharing one instance are judged by a single apply."""
+        bolt = Card(name="Lightning Bolt")
+        filterable_stack: FilterableStack[Card] = FilterableStack(Stack([bolt] * 4))
+        name_filter = CardPropertyFilter("name", FilterOperator.CONTAINS, "bolt")
+
+        filtered_stack = filterable_stack.filter(name_filter)
+
+        assert len(filtered_stack) == 4
+        assert stock_checked == ["Lightning Bolt"]
+
+    def test_subclass_filters_see_every_copy(self) -> None:
+        """Test that subclass filters are applied to each shared copy."""
+        bolt = Card(name="Lightning Bolt")
+        filterable_stack: FilterableStack[Card] = FilterableStack(Stack([bolt] * 4))
+        name_filter = _RecordingFilter("name", FilterOperator.EQUALS, "Lightning Bolt")
+
+        filtered_stack = filterable_stack.filter(name_filter)
+
+        assert len(filtered_stack) == 4
+        assert name_filter.checked == ["Lightning Bolt"] * 4
+
+    def test_in_place_tag_change_is_seen_by_next_filter(self) -> None:
+        """Test that editing a card's tags in place affects the next filter."""
+        card = Card(name="Lightning Bolt", tags={"red"})
+        filterable_stack: FilterableStack[Card] = FilterableStack(Stack([card]))
+        tag_filter = CardPropertyFilter("tags", FilterOperator.EQUALS, {"red"})
+
+        assert len(filterable_stack.filter(tag_filter)) == 1
+
+        card.tags.add("burn")
+        assert len(filterable_stack.filter(tag_filter)) == 0
+
+    def test_contains_filter_runs_after_equality_filter(
+        self,
+        sample_stack: Stack[Print],
+    ) -> None:
+        """Test that CONTAINS only sees cards that passed the equality filter."""
+        filterable_stack: FilterableStack[Print] = FilterableStack(sample_stack)
+        contains_filter = _RecordingFilter("name", FilterOperator.CONTAINS, "bolt")
+        set_filter = CardPropertyFilter("set", FilterOperator.EQUALS, "LEA")
+
+        filtered_stack = filterable_stack.filter(contains_filter, set_filter)
+
+        assert [card.name for card in filtered_stack] == ["Lightning Bolt"]
+        # Only the two LEA prints reach the CONTAINS check
+        assert sorted(contains_filter.checked) == ["Black Lotus", "Lightning Bolt"]
+
     def test_filter_with_no_matches(self, sample_stack: Stack[Print]) -> None:
         """Test filter that matches no cards returns empty stack."""
         filterable_stack: FilterableStack[Print] = FilterableStack(sample_stack)
@@ -416,7 +557,7 @@ class TestFilterableStack:
 
         filtered_stack = filterable_stack.filter(name_filter)
 
-        assert len(list(filtered_stack)) == 0
+        assert len(filtered_stack) == 0
 
     def test_filter_with_all_matches(self, sample_stack: Stack[Print]) -> None:
         """Test filter that matches all cards returns complete stack."""
@@ -514,6 +655,22 @@ class TestFilterableStack:
         print_cards = [card for card in filtered_cards if isinstance(card, Print)]
         assert all(card.set == "LEA" for card in print_cards)
 
+    def test_indexed_filter_sees_cards_added_later(self) -> None:
+        """Test that EQUALS/IN lookups follow changes to the wrapped stack."""
+        stack: Stack[Print] = Stack([Print(name="Lightning Bolt", set="LEA")])
+        filterable_stack: FilterableStack[Print] = FilterableStack(stack)
+        set_filter = CardPropertyFilter("set", FilterOperator.IN, ["LEA", "ICE"])
+        name_filter = CardPropertyFilter("name", FilterOperator.EQUALS, "Counterspell")
+
+        assert len(filterable_stack.filter(set_filter)) == 1
+        assert len(filterable_stack.filter(set_filter, name_filter)) == 0
+
+        stack.add(Print(name="Counterspell", set="ICE"))
+
+        assert len(filterable_stack.filter(set_filter)) == 2
+        matches = filterable_stack.filter(set_filter, name_filter)
+        assert [card.name for card in matches] == ["Counterspell"]
+
     def test_empty_stack_filtering(self) -> None:
         """Test filtering an empty stack returns empty stack."""
         empty_stack: Stack[Print] = Stack()
@@ -526,7 +683,7 @@ class TestFilterableStack:
 
         filtered_stack = filterable_stack.filter(name_filter)
 
-        assert len(list(filtered_stack)) == 0
+        assert len(filtered_stack) == 0
 
     def test_no_filters_returns_copy_of_original_stack(
         self,
@@ -2,29 +2,38 @@
 
 from __future__ import annotations
 
+import re
+from collections import Counter
+from io import StringIO
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 from typing import TYPE_CHECKING
-from unittest.mock import mock_open, patch
+from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
 from stacks.cards.card import Card
 from stacks.cards.print import Print
+from stacks.parsing import io_registry
 from stacks.parsing.abstractions import StackReader, StackWriter
 from stacks.parsing.io_registry import (
     load_stack_from_file,
-    reader_registry,
+    load_stack_from_fileobj,
     register_reader,
     register_writer,
     write_stack_to_file,
-    writer_registry,
 )
 from stacks.stack import Stack
 
 if TYPE_CHECKING:
     from typing import IO
 
+_ERR_UNSUPPORTED_IN = re.compile(r"Unsupported input format: \.xyz")
+_ERR_UNSUPPORTED_IN_NO_EXT = re.compile(r"Unsupported input format: \.testfile")
+_ERR_UNSUPPORTED_OUT = re.compile(r"Unsupported output format: \.xyz")
+_ERR_UNSUPPORTED_OUT_NO_EXT = re.compile(r"Unsupported output format: \.outputfile")
+_ERR_READER_FAILED = re.compile(r"Reader failed")
+_ERR_WRITER_FAILED = re.compile(r"Writer failed")
+
 
 class MockCardReader(StackReader[Card]):
     """Mock reader for testing."""
@@ -50,8 +59,7 @@ class MockCardWriter(StackWriter[Card]):
     def write(self, stack: Stack[Card], file: IO) -> None:
         """Write method for testing."""
         # Simple mock that writes card names
-        for card in stack:
-            file.write(f"{card.name}\n")
+        file.writelines(f"{card.name}\n" for card in stack)
 
 
 class MockPrintWriter(StackWriter[Print]):
@@ -60,13 +68,13 @@ class MockPrintWriter(StackWriter[Print]):
     def write(self, stack: Stack[Print], file: IO) -> None:
         """Write method for testing."""
         # Simple mock that writes print information
-        for print_item in stack:
-            file.write(
-                f"{print_item.name},{print_item.set},{print_item.foil},{print_item.price}\n",
-            )
+        file.writelines(
+            f"{print_item.name},{print_item.set},{print_item.foil},{print_item.price}\n"
+            for print_item in stack
+        )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_stack_cards() -> Stack[Card]:
     """Fixture providing a sample Stack of Cards."""
     return Stack(
@@ -78,7 +86,7 @@ def sample_stack_cards() -> Stack[Card]:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_stack_prints() -> Stack[Print]:
     """Fixture providing a sample Stack of Prints."""
     return Stack(
@@ -92,129 +100,119 @@ def sample_stack_prints() -> Stack[Print]:
 class TestRegistryFunctions:
     """Test the registry decorator functions."""
 
-    def test_register_reader_decorator(self) -> None:
+    def test_register_reader_decorator(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that register_reader properly registers a reader."""
-        # Clear registry first
-        original_registry = reader_registry.copy()
-        reader_registry.clear()
+        # Swap in an empty registry; monkeypatch restores the original
+        registry: dict = {}
+        monkeypatch.setattr(io_registry, "reader_registry", registry)
 
-        try:
-
-            @register_reader("test")
-            class TestReader(StackReader):
-                def read(self, file):
-                    return Stack()
+        @register_reader("test")
+        class TestReader(StackReader):
+            def read(self, file):
+                return Stack()
 
-            assert "test" in reader_registry
-            assert isinstance(reader_registry["test"], TestReader)
-        finally:
-            # Restore original registry
-            reader_registry.clear()
-            reader_registry.update(original_registry)
+        assert "test" in registry
+        assert isinstance(registry["test"], TestReader)
 
-    def test_register_writer_decorator(self) -> None:
+    def test_register_writer_decorator(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that register_writer properly registers a writer."""
-        # Clear registry first
-        original_registry = writer_registry.copy()
-        writer_registry.clear()
+        # Swap in an empty registry; monkeypatch restores the original
+        registry: dict = {}
+        monkeypatch.setattr(io_registry, "writer_registry", registry)
 
-        try:
+        @register_writer("test")
+        class TestWriter(StackWriter):
+            def write(self, stack, file):
+                pass
 
-            @register_writer("test")
-            class TestWriter(StackWriter):
-                def write(self, stack, file):
-                    pass
-
-            assert "test" in writer_registry
-            assert isinstance(writer_registry["test"], TestWriter)
-        finally:
-            # Restore original registry
-            writer_registry.clear()
-            writer_registry.update(original_registry)
+        assert "test" in registry
+        assert isinstance(registry["test"], TestWriter)
 
 
 class TestLoadStackFromFile:
     """Test the load_stack_from_file function."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        # Store original registries
-        self.original_reader_registry = reader_registry.copy()
-
-        # Clear and set up test readers
-        reader_registry.clear()
-        reader_registry["txt"] = MockCardReader()
-        reader_registry["dat"] = MockPrintReader()
-
-    def teardown_method(self) -> None:
-        """Clean up after tests."""
-        # Restore original registry
-        reader_registry.clear()
-        reader_registry.update(self.original_reader_registry)
-
-    def test_load_stack_from_file_success(self) -> None:
-        """Test successful loading of a stack from a file."""
-        mock_file_content = "Test Card\n"
-
-        with patch("pathlib.Path.open", mock_open(read_data=mock_file_content)):
-            stack = load_stack_from_file("test.txt")
-
-            assert isinstance(stack, Stack)
-            cards = list(stack)
-            assert len(cards) == 1
-            assert cards[0].name == "Test Card"
-
-    def test_load_stack_from_file_different_extension(self) -> None:
-        """Test loading with different file extension."""
-        mock_file_content = "Test Print,TST,False,1.0\n"
-
-        with patch("pathlib.Path.open", mock_open(read_data=mock_file_content)):
-            stack = load_stack_from_file("test.dat")
-
-            assert isinstance(stack, Stack)
-            cards = list(stack)
-            assert len(cards) == 1
-            assert cards[0].name == "Test Print"
-
-        with patch("pathlib.Path.open", mock_open(read_data=mock_file_content)):
-            stack = load_stack_from_file("test.dat")
-
-            assert isinstance(stack, Stack)
-            prints = list(stack)
-            assert len(prints) == 1
-            assert prints[0].name == "Test Print"
+    @pytest.fixture(autouse=True)
+    def _readers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Swap in a throwaway reader registry for each test."""
+        monkeypatch.setattr(
+            io_registry,
+            "reader_registry",
+            {"txt": MockCardReader(), "dat": MockPrintReader()},
+        )
+
+    @pytest.fixture
+    def opener(self) -> MagicMock:
+        """Mock opener injected into load_stack_from_file instead of open()."""
+        return mock_open(read_data="")
+
+    def test_load_stack_from_file_success(self, opener: MagicMock) -> None:
+        """Test successful loading of a stack from a file path."""
+        stack = load_stack_from_file("deck.txt", _opener=opener)
+
+        assert isinstance(stack, Stack)
+        cards = list(stack)
+        assert len(cards) == 1
+        assert cards[0].name == "Test Card"
+        assert cards[0].source == Path("deck.txt")
+
+    def test_load_stack_from_fileobj_success(self) -> None:
+        """Test successful loading of a stack from a file object."""
+        stack = load_stack_from_fileobj(StringIO("Test Card\n"), "txt")
+
+        assert isinstance(stack, Stack)
+        cards = list(stack)
+        assert len(cards) == 1
+        assert cards[0].name == "Test Card"
+
+    def test_load_stack_from_fileobj_different_extension(self) -> None:
+        """Test loading from a file object with a different extension."""
+        stack = load_stack_from_fileobj(StringIO("Test Print,TST,False,1.0\n"), "dat")
+
+        assert isinstance(stack, Stack)
+        cards = list(stack)
+        assert len(cards) == 1
+        assert cards[0].name == "Test Print"
 
     def test_load_stack_unsupported_format(self) -> None:
         """Test loading with unsupported file format."""
-        with pytest.raises(ValueError, match="Unsupported input format: .xyz"):
+        with pytest.raises(ValueError, match=_ERR_UNSUPPORTED_IN):
             load_stack_from_file("test.xyz")
 
+    def test_load_stack_from_fileobj_unsupported_format(self) -> None:
+        """Test loading from a file object with an unsupported format."""
+        with pytest.raises(ValueError, match=_ERR_UNSUPPORTED_IN):
+            load_stack_from_fileobj(StringIO(), "xyz")
+
+    def test_load_stack_from_fileobj_sets_source(self) -> None:
+        """Test that load_stack_from_fileobj records the given source."""
+        stack = load_stack_from_fileobj(StringIO(), "txt", Path("deck.txt"))
+
+        assert [card.source for card in stack] == [Path("deck.txt")]
+
     def test_load_stack_no_extension(self) -> None:
         """Test loading file with no extension."""
-        with pytest.raises(ValueError, match="Unsupported input format: .testfile"):
+        with pytest.raises(ValueError, match=_ERR_UNSUPPORTED_IN_NO_EXT):
             load_stack_from_file("testfile")
 
-    def test_load_stack_multiple_dots(self) -> None:
+    def test_load_stack_multiple_dots(self, opener: MagicMock) -> None:
         """Test loading file with multiple dots in filename."""
-        mock_file_content = "Test Card\n"
+        stack = load_stack_from_file("test.backup.txt", _opener=opener)
 
-        with patch("pathlib.Path.open", mock_open(read_data=mock_file_content)):
-            stack = load_stack_from_file("test.backup.txt")
+        assert isinstance(stack, Stack)
+        cards = list(stack)
+        assert len(cards) == 1
 
-            assert isinstance(stack, Stack)
-            cards = list(stack)
-            assert len(cards) == 1
-
-    @patch("pathlib.Path.open")
-    def test_load_stack_file_encoding(self, mock_open_func) -> None:
+    def test_load_stack_file_encoding(self, opener: MagicMock) -> None:
         """Test that file is opened with correct encoding."""
-        reader_registry["txt"] = MockCardReader()
-
-        load_stack_from_file("test.txt")
+        load_stack_from_file("test.txt", _opener=opener)
 
-        mock_open_func.assert_called_once_with(encoding="utf-8")
+        opener.assert_called_once_with(Path("test.txt"), encoding="utf-8")
 
-    def test_load_stack_reader_exception_propagation(self) -> None:
+    def test_load_stack_reader_exception_propagation(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Test that exceptions from readers are properly propagated."""
 
         class FailingReader(StackReader):
@@ -222,33 +220,41 @@ class TestLoadStackFromFile:
                 msg = "Reader failed"
                 raise ValueError(msg)
 
-        reader_registry["fail"] = FailingReader()
+        monkeypatch.setitem(io_registry.reader_registry, "fail", FailingReader())
 
-        with (
-            patch("pathlib.Path.open", mock_open(read_data="")),
-            pytest.raises(ValueError, match="Reader failed"),
-        ):
-            load_stack_from_file("test.fail")
+        with pytest.raises(ValueError, match=_ERR_READER_FAILED):
+            load_stack_from_fileobj(StringIO(), "fail")
 
-    def test_load_stack_from_file_sets_source(self) -> None:
+    def test_load_stack_from_file_sets_source(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        opener: MagicMock,
+    ) -> None:
         """Test that load_stack_from_file sets the source property on cards."""
 
         class MockReaderWithSource(StackReader[Card]):
             def read(self, file: IO) -> Stack[Card]:
                 return Stack([Card(name="Test Card")])
 
-        reader_registry["test"] = MockReaderWithSource()
+        monkeypatch.setitem(
+            io_registry.reader_registry,
+            "test",
+            MockReaderWithSource(),
+        )
 
-        with patch("pathlib.Path.open", mock_open(read_data="test content")):
-            stack = load_stack_from_file("test_file.test")
-            cards = list(stack)
+        stack = load_stack_from_file("test_file.test", _opener=opener)
+        cards = list(stack)
 
-            # Check that all cards have the source property set
-            assert len(cards) == 1
-            assert cards[0].name == "Test Card"
-            assert cards[0].source == Path("test_file.test")
+        # Check that all cards have the source property set
+        assert len(cards) == 1
+        assert cards[0].name == "Test Card"
+        assert cards[0].source == Path("test_file.test")
 
-    def test_load_stack_from_file_uses_read_with_source(self) -> None:
+    def test_load_stack_from_file_uses_read_with_source(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        opener: MagicMock,
+    ) -> None:
         """Test that load_stack_from_file calls read_with_source method."""
 
         class MockReaderForSourceTest(StackReader[Card]):
@@ -268,40 +274,32 @@ class TestLoadStackFromFile:
                 return Stack([Card(name="Test Card", source=source)])
 
         reader_instance = MockReaderForSourceTest()
-        reader_registry["test"] = reader_instance
+        monkeypatch.setitem(io_registry.reader_registry, "test", reader_instance)
 
-        with patch("pathlib.Path.open", mock_open(read_data="test content")):
-            stack = load_stack_from_file("test_file.test")
-            cards = list(stack)
+        stack = load_stack_from_file("test_file.test", _opener=opener)
+        cards = list(stack)
 
-            # Verify that read_with_source was called instead of read
-            assert reader_instance.read_with_source_called is True
-            assert reader_instance.read_called is False
-            assert reader_instance.source_passed == Path("test_file.test")
+        # Verify that read_with_source was called instead of read
+        assert reader_instance.read_with_source_called is True
+        assert reader_instance.read_called is False
+        assert reader_instance.source_passed == Path("test_file.test")
 
-            # Verify source was set on cards
-            assert len(cards) == 1
-            assert cards[0].source == Path("test_file.test")
+        # Verify source was set on cards
+        assert len(cards) == 1
+        assert cards[0].source == Path("test_file.test")
 
 
 class TestWriteStackToFile:
     """Test the write_stack_to_file function."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        # Store original registries
-        self.original_writer_registry = writer_registry.copy()
-
-        # Clear and set up test writers
-        writer_registry.clear()
-        writer_registry["txt"] = MockCardWriter()
-        writer_registry["dat"] = MockPrintWriter()
-
-    def teardown_method(self) -> None:
-        """Clean up after tests."""
-        # Restore original registry
-        writer_registry.clear()
-        writer_registry.update(self.original_writer_registry)
+    @pytest.fixture(autouse=True)
+    def _writers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Swap in a throwaway writer registry for each test."""
+        monkeypatch.setattr(
+            io_registry,
+            "writer_registry",
+            {"txt": MockCardWriter(), "dat": MockPrintWriter()},
+        )
 
     def test_write_stack_to_file_success(self, sample_stack_cards: Stack[Card]) -> None:
         """Test successful writing of a stack to a file."""
@@ -317,7 +315,7 @@ class TestWriteStackToFile:
 
             # Verify write was called on the mock writer
             handle = mock_file.return_value.__enter__.return_value
-            assert handle.write.called
+            assert handle.writelines.called
 
     def test_write_stack_different_extension(
         self,
@@ -333,19 +331,19 @@ class TestWriteStackToFile:
                 newline="",
             )
             handle = mock_file.return_value.__enter__.return_value
-            assert handle.write.called
+            assert handle.writelines.called
 
     def test_write_stack_unsupported_format(
         self,
         sample_stack_cards: Stack[Card],
     ) -> None:
         """Test writing with unsupported file format."""
-        with pytest.raises(ValueError, match="Unsupported output format: .xyz"):
+        with pytest.raises(ValueError, match=_ERR_UNSUPPORTED_OUT):
             write_stack_to_file(sample_stack_cards, "output.xyz")
 
     def test_write_stack_no_extension(self, sample_stack_cards: Stack[Card]) -> None:
         """Test writing file with no extension."""
-        with pytest.raises(ValueError, match="Unsupported output format: .outputfile"):
+        with pytest.raises(ValueError, match=_ERR_UNSUPPORTED_OUT_NO_EXT):
             write_stack_to_file(sample_stack_cards, "outputfile")
 
     def test_write_stack_multiple_dots(self, sample_stack_cards: Stack[Card]) -> None:
@@ -375,6 +373,7 @@ class TestWriteStackToFile:
     def test_write_stack_writer_exception_propagation(
         self,
         sample_stack_cards: Stack[Card],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that exceptions from writers are properly propagated."""
 
@@ -383,11 +382,11 @@ class TestWriteStackToFile:
                 msg = "Writer failed"
                 raise ValueError(msg)
 
-        writer_registry["fail"] = FailingWriter()
+        monkeypatch.setitem(io_registry.writer_registry, "fail", FailingWriter())
 
         with (
             patch("builtins.open", mock_open()),
-            pytest.raises(ValueError, match="Writer failed"),
+            pytest.raises(ValueError, match=_ERR_WRITER_FAILED),
         ):
             write_stack_to_file(sample_stack_cards, "test.fail")
 
@@ -395,78 +394,59 @@ class TestWriteStackToFile:
 class TestIntegration:
     """Integration tests for the io_registry functions."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        # Store original registries
-        self.original_reader_registry = reader_registry.copy()
-        self.original_writer_registry = writer_registry.copy()
-
-    def teardown_method(self) -> None:
-        """Clean up after tests."""
-        # Restore original registries
-        reader_registry.clear()
-        reader_registry.update(self.original_reader_registry)
-        writer_registry.clear()
-        writer_registry.update(self.original_writer_registry)
+    @pytest.fixture(autouse=True)
+    def _registries(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Swap in empty reader and writer registries for each test."""
+        monkeypatch.setattr(io_registry, "reader_registry", {})
+        monkeypatch.setattr(io_registry, "writer_registry", {})
 
     def test_roundtrip_with_real_files(
         self,
         sample_stack_cards: Stack[Card],
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
     ) -> None:
         """Test writing and then reading back a stack using real temporary files."""
 
         # Set up simple text-based reader/writer for testing
         class SimpleTextReader(StackReader[Card]):
             def read(self, file: IO) -> Stack[Card]:
-                cards = []
-                for line in file:
-                    name = line.strip()
-                    if name:
-                        cards.append(Card(name=name))
-                return Stack(cards)
+                names = (line.strip() for line in file.read().splitlines())
+                return Stack([Card(name=name) for name in names if name])
 
         class SimpleTextWriter(StackWriter[Card]):
             def write(self, stack: Stack[Card], file: IO) -> None:
-                for card in stack:
-                    file.write(f"{card.name}\n")
+                file.writelines(f"{card.name}\n" for card in stack)
 
         # Register our test implementations
-        reader_registry.clear()
-        writer_registry.clear()
-        reader_registry["txt"] = SimpleTextReader()
-        writer_registry["txt"] = SimpleTextWriter()
+        monkeypatch.setitem(io_registry.reader_registry, "txt", SimpleTextReader())
+        monkeypatch.setitem(io_registry.writer_registry, "txt", SimpleTextWriter())
 
         # Test roundtrip
-        with NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as temp_file:
-            temp_path = temp_file.name
-
-        try:
-            # Write the stack
-            write_stack_to_file(sample_stack_cards, temp_path)
+        temp_path = str(tmp_path / "roundtrip.txt")
 
-            # Read it back
-            loaded_stack = load_stack_from_file(temp_path)
+        # Write the stack
+        write_stack_to_file(sample_stack_cards, temp_path)
 
-            # Compare
-            original_cards = sorted([card.name for card in sample_stack_cards])
-            loaded_cards = sorted([card.name for card in loaded_stack])
+        # Read it back
+        loaded_stack = load_stack_from_file(temp_path)
 
-            assert original_cards == loaded_cards
-        finally:
-            # Clean up
-            Path(temp_path).unlink(missing_ok=True)
+        # Compare
+        assert Counter(card.name for card in loaded_stack) == Counter(
+            card.name for card in sample_stack_cards
+        )
 
-    def test_registry_isolation(self) -> None:
+    def test_registry_isolation(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that reader and writer registries are independent."""
-        reader_registry.clear()
-        writer_registry.clear()
+        reader_registry = io_registry.reader_registry
+        writer_registry = io_registry.writer_registry
 
-        reader_registry["test"] = MockCardReader()
+        monkeypatch.setitem(reader_registry, "test", MockCardReader())
 
         # Writer registry should still be empty
         assert "test" not in writer_registry
 
-        writer_registry["test"] = MockCardWriter()
+        monkeypatch.setitem(writer_registry, "test", MockCardWriter())
 
         # Both should now have the "test" key but different instances
         assert "test" in reader_registry
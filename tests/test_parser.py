@@ -1,5 +1,7 @@
 """Tests for the Arena deck parser."""
 
+import re
+from collections import Counter
 from io import StringIO
 from pathlib import Path
 
@@ -9,12 +11,30 @@ from stacks.cards.card import Card
 from stacks.cards.print import Print
 from stacks.parsing.arena import parse_arena_deck_content, parse_arena_deck_file
 from stacks.parsing.csv import (
+    CsvStackReader,
     CsvStackWriter,
     parse_csv_collection_content,
     parse_csv_collection_file,
     write_csv_collection_content,
     write_csv_collection_file,
 )
+from stacks.stack import Stack
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+_AMULET_PATH = DATA_DIR / "decks" / "amulet_titan.arena"
+
+_ERR_INVALID_CARD = re.compile(r"Invalid card line format")
+_ERR_COUNT_POS = re.compile(r"Count must be positive")
+_ERR_INVALID_COUNT = re.compile(r"Invalid count")
+_ERR_EMPTY_NAME = re.compile(r"Card name cannot be empty")
+_ERR_INVALID_PRICE = re.compile(r"Invalid price")
+_ERR_EMPTY_STACK = re.compile(r"Cannot write an empty stack")
+
+_CSV_HEADER = "Count,Card Name,Set Name,Collector Number,Foil,Price\n"
+_CSV_INVALID_COUNT = _CSV_HEADER + "notanumber,Lightning Bolt,Beta,1,false,100.00\n"
+_CSV_ZERO_COUNT = _CSV_HEADER + "0,Lightning Bolt,Beta,1,false,100.00\n"
+_CSV_EMPTY_CARD_NAME = _CSV_HEADER + "1,,Beta,1,false,100.00\n"
+_CSV_INVALID_PRICE = _CSV_HEADER + "1,Lightning Bolt,Beta,1,false,notanumber\n"
 
 
 def test_parse_arena_deck_content() -> None:
@@ -30,19 +50,21 @@ Sideboard
 """
 
     stack = parse_arena_deck_content(content)
+    items = list(stack)
+    counts = Counter(card.name for card in items)
 
     # Check individual card counts
-    assert stack.count(Card(name="Lightning Bolt")) == 4
-    assert stack.count(Card(name="Counterspell")) == 2
-    assert stack.count(Card(name="Black Lotus")) == 1
-    assert stack.count(Card(name="Pyroblast")) == 2
-    assert stack.count(Card(name="Red Elemental Blast")) == 1
+    assert counts["Lightning Bolt"] == 4
+    assert counts["Counterspell"] == 2
+    assert counts["Black Lotus"] == 1
+    assert counts["Pyroblast"] == 2
+    assert counts["Red Elemental Blast"] == 1
 
     # Check total count
-    assert len(list(stack)) == 10
+    assert len(items) == 10
 
     # Check unique cards count
-    assert len(stack.unique_cards()) == 5
+    assert len(counts) == 5
 
 
 def test_parse_arena_deck_content_with_empty_lines() -> None:
@@ -59,51 +81,103 @@ Sideboard
 """
 
     stack = parse_arena_deck_content(content)
+    items = list(stack)
+    counts = Counter(card.name for card in items)
 
-    assert stack.count(Card(name="Lightning Bolt")) == 4
-    assert stack.count(Card(name="Counterspell")) == 2
-    assert stack.count(Card(name="Pyroblast")) == 1
-    assert len(list(stack)) == 7
+    assert counts["Lightning Bolt"] == 4
+    assert counts["Counterspell"] == 2
+    assert counts["Pyroblast"] == 1
+    assert len(items) == 7
 
 
-def test_parse_arena_deck_content_invalid_format() -> None:
-    """Test parsing Arena deck content with invalid format."""
-    content = """Deck
-4 Lightning Bolt
-Invalid Line Without Number
+def test_parse_arena_deck_content_skips_other_section_headers() -> None:
+    """Test that Commander and Maybeboard headers are skipped like Deck."""
+    content = """Commander
+1 Atraxa, Praetors' Voice
+
+Deck
+1 Sol Ring
+
+Maybeboard
+1 Mana Crypt
 """
 
-    with pytest.raises(ValueError, match="Invalid card line format"):
-        parse_arena_deck_content(content)
+    names = [card.name for card in parse_arena_deck_content(content)]
 
+    assert names == ["Atraxa, Praetors' Voice", "Sol Ring", "Mana Crypt"]
 
-def test_parse_arena_deck_content_invalid_format_with_letters() -> None:
-    """Test parsing Arena deck content with letters instead of count."""
-    content = """Deck
-abc Lightning Bolt
-"""
 
-    with pytest.raises(ValueError, match="Invalid card line format"):
-        parse_arena_deck_content(content)
+def test_parse_arena_deck_content_with_crlf_and_padding() -> None:
+    """Test that CRLF endings and padded lines parse to trimmed names."""
+    content = "Deck\r\n  4   Lightning Bolt  \r\n\r\nSideboard \r\n1 Pyroblast\r\n"
 
+    counts = Counter(card.name for card in parse_arena_deck_content(content))
 
-def test_parse_arena_deck_content_invalid_format_with_decimal() -> None:
-    """Test parsing Arena deck content with decimal count."""
-    content = """Deck
-4.5 Lightning Bolt
-"""
+    assert counts == Counter({"Lightning Bolt": 4, "Pyroblast": 1})
+
+
+def test_parse_arena_deck_content_with_bare_cr_line_endings() -> None:
+    """Test that bare carriage-return line endings split lines like newlines."""
+    content = "Deck\r4 Lightning Bolt\r\rSideboard\r1 Pyroblast\r"
 
-    with pytest.raises(ValueError, match="Invalid card line format"):
+    counts = Counter(card.name for card in parse_arena_deck_content(content))
+
+    assert counts == Counter({"Lightning Bolt": 4, "Pyroblast": 1})
+
+
+def test_parse_arena_deck_content_keeps_other_line_separators_in_line() -> None:
+    """Test that only CR and LF end lines, whatever else the deck contains."""
+    content = "Deck\r\n1 Fire\u2028Ice\r\n"
+
+    names = [card.name for card in parse_arena_deck_content(content)]
+
+    assert names == ["Fire\u2028Ice"]
+
+
+def test_parse_arena_deck_content_reports_invalid_line_number() -> None:
+    """Test that the invalid-line error names the offending line."""
+    with pytest.raises(ValueError, match=r"at line 3: '4\.5 Lightning Bolt'"):
+        parse_arena_deck_content("Deck\n1 Sol Ring\n4.5 Lightning Bolt\n")
+
+
+def test_parse_arena_deck_content_reports_first_error_in_file_order() -> None:
+    """Test that a bad count before a malformed line is the reported error."""
+    content = "Deck\n0 Lightning Bolt\nInvalid Line Without Number\n"
+
+    with pytest.raises(ValueError, match=r"got 0 at line 2"):
         parse_arena_deck_content(content)
 
 
-def test_parse_arena_deck_content_zero_count() -> None:
-    """Test parsing Arena deck content with zero count."""
-    content = """Deck
-0 Lightning Bolt
-"""
+def test_parse_arena_deck_content_line_numbers_count_leading_blanks() -> None:
+    """Test that error line numbers are absolute file lines."""
+    with pytest.raises(ValueError, match=r"at line 4: 'oops'"):
+        parse_arena_deck_content("\n\nDeck\noops\n")
+
+
+def test_parse_arena_deck_content_copies_share_instance() -> None:
+    """Test that copies from a single deck line reuse one validated card."""
+    cards = list(parse_arena_deck_content("Deck\n4 Lightning Bolt\n"))
 
-    with pytest.raises(ValueError, match="Count must be positive"):
+    assert len(cards) == 4
+    assert all(card is cards[0] for card in cards)
+
+
+@pytest.mark.parametrize(
+    ("content", "match"),
+    [
+        (
+            "Deck\n4 Lightning Bolt\nInvalid Line Without Number\n",
+            _ERR_INVALID_CARD,
+        ),
+        ("Deck\nabc Lightning Bolt\n", _ERR_INVALID_CARD),
+        ("Deck\n4.5 Lightning Bolt\n", _ERR_INVALID_CARD),
+        ("Deck\n0 Lightning Bolt\n", _ERR_COUNT_POS),
+    ],
+    ids=["missing_count", "letters", "decimal", "zero_count"],
+)
+def test_parse_arena_deck_content_invalid(content: str, match: re.Pattern[str]) -> None:
+    """Test that malformed Arena deck lines are rejected."""
+    with pytest.raises(ValueError, match=match):
         parse_arena_deck_content(content)
 
 
@@ -113,21 +187,23 @@ def test_parse_arena_deck_file_not_found() -> None:
         parse_arena_deck_file("non_existent_file.arena")
 
 
-def test_parse_real_amulet_titan_deck() -> None:
-    """Test parsing the actual Amulet Titan deck file."""
-    deck_path = Path(__file__).parent.parent / "data" / "decks" / "amulet_titan.arena"
+@pytest.fixture(scope="session")
+def amulet_titan_stack() -> Stack[Card]:
+    """Parse the Amulet Titan deck file once per session."""
+    return parse_arena_deck_file(_AMULET_PATH)
 
-    if deck_path.exists():
-        stack = parse_arena_deck_file(deck_path)
 
-        # Check that we have cards
-        assert len(list(stack)) > 0
-        assert len(stack.unique_cards()) > 0
+@pytest.mark.skipif(not _AMULET_PATH.exists(), reason="deck file missing")
+def test_parse_real_amulet_titan_deck(amulet_titan_stack: Stack[Card]) -> None:
+    """Test parsing the actual Amulet Titan deck file."""
+    # Check that we have cards
+    assert len(amulet_titan_stack) > 0
+    assert len(amulet_titan_stack.unique_cards()) > 0
 
-        # Check specific cards we know are in the deck
-        assert stack.count(Card(name="Primeval Titan")) == 4
-        assert stack.count(Card(name="Amulet of Vigor")) == 4
-        assert stack.count(Card(name="Scapeshift")) == 4
+    # Check specific cards we know are in the deck
+    assert amulet_titan_stack.count(Card(name="Primeval Titan")) == 4
+    assert amulet_titan_stack.count(Card(name="Amulet of Vigor")) == 4
+    assert amulet_titan_stack.count(Card(name="Scapeshift")) == 4
 
 
 def test_parse_arena_deck_file_sets_source() -> None:
@@ -165,6 +241,17 @@ def test_parse_arena_deck_file_sets_source() -> None:
         temp_path.unlink()
 
 
+def test_parse_arena_deck_file_source_copies_share_instance(tmp_path: Path) -> None:
+    """Test that attaching the source keeps copies of a card on one instance."""
+    deck_path = tmp_path / "deck.arena"
+    deck_path.write_text("Deck\n4 Lightning Bolt\n", encoding="utf-8")
+
+    cards = list(parse_arena_deck_file(deck_path))
+
+    assert cards[0].source == deck_path
+    assert all(card is cards[0] for card in cards)
+
+
 def test_parse_arena_deck_content_no_source() -> None:
     """Test that parsing Arena deck content doesn't set source when no file involved."""
     content = """Deck
@@ -188,6 +275,8 @@ def test_parse_csv_collection_content() -> None:
 """)
 
     stack = parse_csv_collection_content(csv_content)
+    items = list(stack)
+    counts = Counter(items)
 
     # Check individual card counts
     lightning_bolt = Print(
@@ -212,15 +301,73 @@ def test_parse_csv_collection_content() -> None:
         collector_number="3",
     )
 
-    assert stack.count(lightning_bolt) == 1
-    assert stack.count(counterspell) == 2
-    assert stack.count(black_lotus) == 1
+    assert counts[lightning_bolt] == 1
+    assert counts[counterspell] == 2
+    assert counts[black_lotus] == 1
 
     # Check total count
-    assert len(list(stack)) == 4
+    assert len(items) == 4
 
     # Check unique cards count
-    assert len(stack.unique_cards()) == 3
+    assert len(counts) == 3
+
+
+def test_parse_csv_collection_content_copies_share_instance() -> None:
+    """Test that copies from a single CSV row reuse one validated card."""
+    csv_content = StringIO("""Count,Card Name,Set Name,Collector Number,Foil,Price
+3,Lightning Bolt,Beta,1,false,100.00
+""")
+
+    stack = parse_csv_collection_content(csv_content)
+    cards = list(stack)
+
+    assert len(cards) == 3
+    assert all(card is cards[0] for card in cards)
+
+
+def test_parse_csv_collection_content_identical_rows_share_instance() -> None:
+    """Test that separate rows describing the same print reuse one instance."""
+    csv_content = StringIO(
+        _CSV_HEADER
+        + "1,Lightning Bolt,Beta,1,false,100.00\n"
+        + "2,Lightning Bolt,Beta,1,false,100.00\n"
+        + "1,Lightning Bolt,Beta,1,true,100.00\n",
+    )
+
+    cards = list(parse_csv_collection_content(csv_content))
+
+    assert cards[0] is cards[1] is cards[2]
+    assert cards[3] is not cards[0]
+
+
+def test_parse_csv_collection_content_identical_basic_rows_share_instance() -> None:
+    """Test that separate basic-card rows with the same tags reuse one instance."""
+    csv_content = StringIO(
+        "Count,Card Name,Tags\n1,Forest,land\n1,Forest,land\n1,Forest,basic\n",
+    )
+
+    cards = list(parse_csv_collection_content(csv_content))
+
+    assert cards[0] is cards[1]
+    assert cards[2] is not cards[0]
+    assert cards[2].tags == {"basic"}
+
+
+def test_parse_csv_collection_file_source_rows_share_instance(tmp_path: Path) -> None:
+    """Test that attaching the source keeps identical rows on one instance."""
+    csv_path = tmp_path / "collection.csv"
+    csv_path.write_text(
+        _CSV_HEADER
+        + "2,Lightning Bolt,Beta,1,false,100.00\n"
+        + "1,Lightning Bolt,Beta,1,false,100.00\n",
+        encoding="utf-8",
+    )
+
+    cards = list(parse_csv_collection_file(csv_path))
+
+    assert len(cards) == 3
+    assert cards[0].source == csv_path
+    assert all(card is cards[0] for card in cards)
 
 
 def test_parse_csv_collection_content_with_empty_price() -> None:
@@ -253,44 +400,23 @@ def test_parse_csv_collection_content_basic_format() -> None:
     assert cards[0].name == "Lightning Bolt"
 
 
-def test_parse_csv_collection_content_invalid_count() -> None:
-    """Test parsing CSV collection content with invalid count."""
-    csv_content = StringIO("""Count,Card Name,Set Name,Collector Number,Foil,Price
-notanumber,Lightning Bolt,Beta,1,false,100.00
-""")
-
-    with pytest.raises(ValueError, match="Invalid count"):
-        parse_csv_collection_content(csv_content)
-
-
-def test_parse_csv_collection_content_zero_count() -> None:
-    """Test parsing CSV collection content with zero count."""
-    csv_content = StringIO("""Count,Card Name,Set Name,Collector Number,Foil,Price
-0,Lightning Bolt,Beta,1,false,100.00
-""")
-
-    with pytest.raises(ValueError, match="Count must be positive"):
-        parse_csv_collection_content(csv_content)
-
-
-def test_parse_csv_collection_content_empty_card_name() -> None:
-    """Test parsing CSV collection content with empty card name."""
-    csv_content = StringIO("""Count,Card Name,Set Name,Collector Number,Foil,Price
-1,,Beta,1,false,100.00
-""")
-
-    with pytest.raises(ValueError, match="Card name cannot be empty"):
-        parse_csv_collection_content(csv_content)
-
-
-def test_parse_csv_collection_content_invalid_price() -> None:
-    """Test parsing CSV collection content with invalid price."""
-    csv_content = StringIO("""Count,Card Name,Set Name,Collector Number,Foil,Price
-1,Lightning Bolt,Beta,1,false,notanumber
-""")
-
-    with pytest.raises(ValueError, match="Invalid price"):
-        parse_csv_collection_content(csv_content)
+@pytest.mark.parametrize(
+    ("text", "match"),
+    [
+        (_CSV_INVALID_COUNT, _ERR_INVALID_COUNT),
+        (_CSV_ZERO_COUNT, _ERR_COUNT_POS),
+        (_CSV_EMPTY_CARD_NAME, _ERR_EMPTY_NAME),
+        (_CSV_INVALID_PRICE, _ERR_INVALID_PRICE),
+    ],
+    ids=["invalid_count", "zero_count", "empty_card_name", "invalid_price"],
+)
+def test_parse_csv_collection_content_invalid(
+    text: str,
+    match: re.Pattern[str],
+) -> None:
+    """Test that invalid CSV collection rows are rejected."""
+    with pytest.raises(ValueError, match=match):
+        parse_csv_collection_content(StringIO(text))
 
 
 def test_parse_csv_collection_content_foil_variations() -> None:
@@ -305,14 +431,32 @@ def test_parse_csv_collection_content_foil_variations() -> None:
 """)
 
     stack = parse_csv_collection_content(csv_content)
-    cards = stack.unique_cards()
 
     # Check foil values are parsed correctly
-    foil_cards = [card for card in cards if card.foil]
-    non_foil_cards = [card for card in cards if not card.foil]
+    foil_count = non_foil_count = 0
+    for card in stack.unique_cards():
+        foil_count += card.foil
+        non_foil_count += not card.foil
+
+    assert foil_count == 3  # true, 1, yes
+    assert non_foil_count == 3  # false, 0, no
+
+
+@pytest.mark.parametrize(
+    ("foil", "expected"),
+    [(" TRUE ", True), ("t", True), ("Y", True), ("f", False), ("", False)],
+    ids=["padded_upper_true", "t", "upper_y", "f", "empty"],
+)
+def test_parse_csv_collection_content_foil_normalization(
+    foil: str,
+    expected: bool,  # noqa: FBT001
+) -> None:
+    """Test that foil cells are trimmed, case-folded, and accept short forms."""
+    csv_content = StringIO(f"{_CSV_HEADER}1,Lightning Bolt,Beta,1,{foil},1.00\n")
+
+    (card,) = parse_csv_collection_content(csv_content)
 
-    assert len(foil_cards) == 3  # true, 1, yes
-    assert len(non_foil_cards) == 3  # false, 0, no
+    assert card.foil is expected
 
 
 def test_parse_csv_collection_file_sets_source() -> None:
@@ -422,6 +566,36 @@ def test_csv_stack_writer_groups_duplicate_prints() -> None:
     assert len(lines) == 3  # Header + 2 data rows (grouped)
 
 
+def test_csv_stack_writer_groups_shared_and_distinct_instances() -> None:
+    """Test that shared copies and equal separate instances form one row."""
+    bolt = Print(name="Lightning Bolt", set="LEA", foil=False, price=10.0)
+    stack = Stack([bolt, bolt, Print(name="Lightning Bolt", set="LEA", price=10.0)])
+
+    output = StringIO()
+    CsvStackWriter().write(stack, output)
+
+    lines = output.getvalue().splitlines()
+    assert lines[1:] == ["3,Lightning Bolt,LEA,,false,10.0,"]
+
+
+def test_csv_stack_writer_quotes_fields_with_commas() -> None:
+    """Test that names and tag lists containing commas survive a round trip."""
+    atraxa = Print(
+        name="Atraxa, Praetors' Voice",
+        set="C16",
+        price=20.0,
+        tags={"edh", "commander"},
+    )
+
+    output = StringIO()
+    CsvStackWriter().write(Stack([atraxa]), output)
+    output.seek(0)
+
+    assert [card.name for card in parse_csv_collection_content(output)] == [
+        "Atraxa, Praetors' Voice",
+    ]
+
+
 def test_csv_stack_writer_handles_different_properties() -> None:
     """Test that prints with different properties are treated as separate."""
     from stacks.stack import Stack
@@ -486,7 +660,7 @@ def test_csv_stack_writer_empty_stack_raises_error() -> None:
     writer = CsvStackWriter()
     output = StringIO()
 
-    with pytest.raises(ValueError, match="Cannot write an empty stack"):
+    with pytest.raises(ValueError, match=_ERR_EMPTY_STACK):
         writer.write(empty_stack, output)
 
 
@@ -563,8 +737,6 @@ def test_write_csv_collection_file(tmp_path: Path) -> None:
 
 def test_csv_round_trip() -> None:
     """Test that writing and reading a CSV produces the same data."""
-    from stacks.stack import Stack
-
     original_prints = [
         Print(name="Lightning Bolt", set="LEA", foil=False, price=10.0),
         Print(name="Lightning Bolt", set="LEA", foil=False, price=10.0),
@@ -582,16 +754,57 @@ def test_csv_round_trip() -> None:
     output.seek(0)
     read_stack = parse_csv_collection_content(output)
 
-    # Compare counts for each unique card
-    original_unique = original_stack.unique_cards()
-    read_unique = read_stack.unique_cards()
+    # Compare the per-card counts of both stacks in one dict comparison
+    assert dict(read_stack.items()) == dict(original_stack.items())
+
+
+def test_csv_row_round_trip() -> None:
+    """Test that writer rows feed the reader directly without a text buffer."""
+    original_stack = Stack(
+        [
+            Print(name="Lightning Bolt", set="LEA", foil=False, price=10.0),
+            Print(name="Lightning Bolt", set="LEA", foil=False, price=10.0),
+            Print(name="Fire, Ice", set="APC", foil=True, price=None, tags={"a", "b"}),
+        ],
+    )
+
+    rows = CsvStackWriter().iter_rows(original_stack)
+    read_stack = CsvStackReader().from_rows(rows)
+
+    assert dict(read_stack.items()) == dict(original_stack.items())
+    assert {card.name: card.tags for card in read_stack} == {
+        "Lightning Bolt": set(),
+        "Fire, Ice": {"a", "b"},
+    }
+
+
+def test_csv_reader_from_rows_skips_empty_rows() -> None:
+    """Test that empty rows are skipped like blank lines in a CSV file."""
+    rows = [["Count", "Card Name"], ["2", "Forest"], [], ["1", "Island"]]
+
+    counts = Counter(card.name for card in CsvStackReader().from_rows(rows))
+
+    assert counts == Counter({"Forest": 2, "Island": 1})
+
+
+def test_csv_missing_columns_listed_in_sorted_order() -> None:
+    """Test that the missing-column error lists the columns readably."""
+    with pytest.raises(
+        ValueError,
+        match=re.escape("format: ['Card Name', 'Count']"),
+    ):
+        parse_csv_collection_content(StringIO("Name,Tags\nForest,land\n"))
+
 
-    assert len(original_unique) == len(read_unique)
+def test_csv_short_row_rejected_from_file_and_rows() -> None:
+    """Test that a row missing columns gets the same error from both inputs."""
+    rows = [["Count", "Card Name", "Set Name"], ["2", "Forest", "LEA"], ["1"]]
+    text = "Count,Card Name,Set Name\n2,Forest,LEA\n1\n"
 
-    for original_card in original_unique:
-        original_count = original_stack.count(original_card)
-        read_count = read_stack.count(original_card)
-        assert original_count == read_count, f"Count mismatch for {original_card.name}"
+    with pytest.raises(ValueError, match=r"Row 3 has fewer columns"):
+        CsvStackReader().from_rows(rows)
+    with pytest.raises(ValueError, match=r"Row 3 has fewer columns"):
+        parse_csv_collection_content(StringIO(text))
 
 
 # Auto-detection tests for different CSV formats
@@ -8,6 +8,7 @@ from stacks.cards.card import Card
 from stacks.cards.scryfall_card import ScryfallCard
 from stacks.scryfall.client import ScryfallClient
 from stacks.scryfall.scryer import Scryer
+from stacks.stack import Stack
 
 
 class TestScryer:
@@ -221,8 +222,6 @@ class TestScryer:
     def test_enrich_stack_success(self) -> None:
         """Test enriching a stack of cards with Scryfall data."""
         # Arrange
-        from stacks.stack import Stack
-
         card1 = Card(name="Lightning Bolt")
         card2 = Card(name="Counterspell")
         card3 = Card(name="Unknown Card")  # This won't be found
@@ -275,8 +274,6 @@ class TestScryer:
     def test_enrich_stack_with_set_code(self) -> None:
         """Test enriching a stack with a specific set code."""
         # Arrange
-        from stacks.stack import Stack
-
         card = Card(name="Lightning Bolt")
         original_stack = Stack([card])
 
@@ -302,8 +299,6 @@ class TestScryer:
     def test_enrich_stack_empty_stack(self) -> None:
         """Test enriching an empty stack."""
         # Arrange
-        from stacks.stack import Stack
-
         empty_stack: Stack = Stack()
 
         # Act
@@ -311,5 +306,28 @@ class TestScryer:
 
         # Assert
         assert isinstance(result_stack, Stack)
-        assert len(list(result_stack)) == 0
+        assert len(result_stack) == 0
         assert self.mock_client.get_card_by_name.call_count == 0
+
+    def test_enrich_stack_looks_up_each_unique_card_once(self) -> None:
+        """Test that copies of a card share a single Scryfall lookup."""
+        # Arrange
+        card = Card(name="Lightning Bolt")
+        original_stack = Stack([card, card, card, card])
+
+        scryfall_data = {
+            "name": "Lightning Bolt",
+            "oracle_id": "test-oracle-id",
+            "prices": {"usd": "1.00"},
+        }
+        self.mock_client.get_card_by_name.return_value = scryfall_data
+
+        # Act
+        result_stack = self.scryer.enrich_stack(original_stack)
+
+        # Assert
+        assert len(result_stack) == 4
+        self.mock_client.get_card_by_name.assert_called_once_with(
+            "Lightning Bolt",
+            None,
+        )
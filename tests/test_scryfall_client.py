@@ -15,7 +15,7 @@ class TestScryfallClient:
         """Set up test fixtures."""
         self.client = ScryfallClient()
 
-    @patch("stacks.scryfall.client.requests.get")
+    @patch("requests.get")
     def test_get_card_by_name_success(self, mock_get: Mock) -> None:
         """Test successful card retrieval by name."""
         # Arrange
@@ -47,7 +47,7 @@ class TestScryfallClient:
             timeout=10,
         )
 
-    @patch("stacks.scryfall.client.requests.get")
+    @patch("requests.get")
     def test_get_card_by_name_with_set_code(self, mock_get: Mock) -> None:
         """Test card retrieval by name with set code."""
         # Arrange
@@ -68,7 +68,7 @@ class TestScryfallClient:
             timeout=10,
         )
 
-    @patch("stacks.scryfall.client.requests.get")
+    @patch("requests.get")
     def test_get_card_by_name_not_found(self, mock_get: Mock) -> None:
         """Test card retrieval when card is not found."""
         # Arrange
@@ -87,7 +87,7 @@ class TestScryfallClient:
             timeout=10,
         )
 
-    @patch("stacks.scryfall.client.requests.get")
+    @patch("requests.get")
     def test_get_card_by_name_http_error(self, mock_get: Mock) -> None:
         """Test card retrieval when HTTP error occurs."""
         # Arrange
@@ -100,7 +100,7 @@ class TestScryfallClient:
         with pytest.raises(requests.HTTPError):
             self.client.get_card_by_name("Lightning Bolt")
 
-    @patch("stacks.scryfall.client.requests.get")
+    @patch("requests.get")
     def test_get_card_by_name_timeout(self, mock_get: Mock) -> None:
         """Test card retrieval when timeout occurs."""
         # Arrange
@@ -1,5 +1,7 @@
 """Tests for the Stack class."""
 
+import pytest
+
 from stacks.cards.card import Card
 from stacks.cards.print import Print
 from stacks.cards.scryfall_card import ScryfallCard
@@ -23,7 +25,7 @@ class TestStack:
 
         stack: Stack[Card] = Stack([card1, card2, card1])
 
-        assert len(list(stack)) == 3
+        assert len(stack) == 3
         assert len(stack.unique_cards()) == 2
         assert stack.count(card1) == 2
         assert stack.count(card2) == 1
@@ -35,7 +37,7 @@ class TestStack:
 
         assert stack.count(sample_card) == 1
         assert sample_card in stack.unique_cards()
-        assert len(list(stack)) == 1
+        assert len(stack) == 1
 
     def test_add_multiple_same_cards(self) -> None:
         """Test adding multiple copies of the same card."""
@@ -48,7 +50,28 @@ class TestStack:
 
         assert stack.count(card) == 3
         assert len(stack.unique_cards()) == 1
-        assert len(list(stack)) == 3
+        assert len(stack) == 3
+
+    def test_add_with_count(self) -> None:
+        """Test adding several copies of a card in one call."""
+        stack: Stack[Card] = Stack()
+        card = Card(name="Lightning Bolt")
+
+        stack.add(card, count=4)
+
+        assert stack.count(card) == 4
+        assert len(stack) == 4
+        assert all(copy is card for copy in stack)
+
+    @pytest.mark.parametrize("count", [0, -1])
+    def test_add_rejects_non_positive_count(self, count: int) -> None:
+        """Test that add refuses counts below one."""
+        stack: Stack[Card] = Stack()
+
+        with pytest.raises(ValueError, match="Count must be at least 1"):
+            stack.add(Card(name="Lightning Bolt"), count=count)
+
+        assert len(stack) == 0
 
     def test_add_different_cards(self) -> None:
         """Test adding different cards to the stack."""
@@ -65,7 +88,7 @@ class TestStack:
         assert stack.count(card2) == 1
         assert stack.count(card3) == 1
         assert len(stack.unique_cards()) == 3
-        assert len(list(stack)) == 3
+        assert len(stack) == 3
 
     def test_count_nonexistent_card(self) -> None:
         """Test counting a card that's not in the stack."""
@@ -807,6 +830,42 @@ class TestStack:
         assert result.count(card1) == 1
         assert result.count(card2) == 1
 
+    def test_union_result_is_independent_of_originals(self) -> None:
+        """Test that adding to a union result does not modify the originals."""
+        card = Card(name="Lightning Bolt")
+        stack1: Stack[Card] = Stack([card])
+        stack2: Stack[Card] = Stack([card])
+
+        result = stack1.union(stack2)
+        result.add(card)
+
+        assert result.count(card) == 3
+        assert stack1.count(card) == 1
+        assert stack2.count(card) == 1
+
+    def test_copy_is_independent_of_original(self) -> None:
+        """Test that adding to a copy does not modify the original stack."""
+        card = Card(name="Lightning Bolt")
+        stack: Stack[Card] = Stack([card, card])
+
+        copied = stack.copy()
+        copied.add(card)
+
+        assert copied.count(card) == 3
+        assert stack.count(card) == 2
+
+    def test_version_changes_when_stack_changes(self) -> None:
+        """Test that the version moves on add and add_tag."""
+        stack: Stack[Card] = Stack()
+        versions = [stack.version]
+
+        stack.add(Card(name="Lightning Bolt"))
+        versions.append(stack.version)
+        stack.add_tag("burn")
+        versions.append(stack.version)
+
+        assert len(set(versions)) == 3
+
     def test_set_operations_with_print_cards(self) -> None:
         """Test set operations work correctly with Print cards."""
         from stacks.cards.print import Print
@@ -882,7 +941,7 @@ class TestStack:
         stack: Stack[Card] = Stack()
         stack.add_tag("test-tag")
 
-        assert len(list(stack)) == 0
+        assert len(stack) == 0
         assert stack.unique_cards() == []
 
     def test_add_tag_single_card(self) -> None:
@@ -998,7 +1057,7 @@ class TestStack:
 
         result = stack.match(query_card)
 
-        assert len(list(result)) == 1
+        assert len(result) == 1
         assert len(result.unique_cards()) == 1
         assert card1 in result.unique_cards()
         assert result.count(card1) == 1
@@ -1017,7 +1076,7 @@ class TestStack:
 
         result = stack.match(query_card)
 
-        assert len(list(result)) == 3
+        assert len(result) == 3
         assert len(result.unique_cards()) == 1
         assert card1 in result.unique_cards()
         assert result.count(card1) == 3
@@ -1034,7 +1093,7 @@ class TestStack:
         result = stack.match(query_card)
 
         # Should match because cards are equal, even if not the same object
-        assert len(list(result)) == 1
+        assert len(result) == 1
         assert card1 in result.unique_cards()
         assert result.count(card1) == 1
 
@@ -1070,7 +1129,7 @@ class TestStack:
 
         result = stack.match(query_print)
 
-        assert len(list(result)) == 1
+        assert len(result) == 1
         assert print1 in result.unique_cards()
 
     def test_match_preserves_original_stack(self) -> None:
@@ -1083,13 +1142,13 @@ class TestStack:
         stack.add(card1)
         stack.add(card2)
 
-        original_count = len(list(stack))
+        original_count = len(stack)
         original_unique_count = len(stack.unique_cards())
 
         stack.match(query_card)
 
         # Original stack should be unchanged
-        assert len(list(stack)) == original_count
+        assert len(stack) == original_count
         assert len(stack.unique_cards()) == original_unique_count
         assert stack.count(card1) == 1
         assert stack.count(card2) == 1
@@ -1120,5 +1179,5 @@ class TestStack:
 
         result = stack.match(query_card)
 
-        assert len(list(result)) == 2
+        assert len(result) == 2
         assert len(result.unique_cards()) == 1